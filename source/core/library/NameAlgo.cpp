@@ -7,11 +7,17 @@
 #include "TfUtils.h"
 
 #include <pxr/base/tf/stringUtils.h>
-#include <pxr/usd/sdf/childrenView.h>
+#include <pxr/base/work/loops.h>
+#include <pxr/usd/sdf/layer.h>
 #include <pxr/usd/sdf/schema.h>
 #include <pxr/usd/sdf/spec.h>
 
-#include <functional>
+#include <array>
+#include <charconv>
+#include <limits>
+#include <string>
+#include <string_view>
+#include <unordered_map>
 
 using namespace pxr;
 
@@ -30,19 +36,17 @@ TF_DEFINE_PRIVATE_TOKENS(_tokens, (error));
 struct ValidNameCache
 {
     //! Names that can not be allocated
-    TfTokenVector usedNames;
+    TfToken::HashSet usedNames;
 
-    // The start index to be used for making a given name unique
+    // The last numeric suffix used when making a given name unique. Suffixes only ever advance, so names that were already
+    // considered are not probed again by subsequent requests for the same name.
     std::unordered_map<std::string, size_t> startIndices;
 };
 
 void reserveNames(ValidNameCache& cache, const TfTokenVector& names)
 {
     cache.usedNames.reserve(cache.usedNames.size() + names.size());
-    for (const TfToken& name : names)
-    {
-        cache.usedNames.push_back(name);
-    }
+    cache.usedNames.insert(names.begin(), names.end());
 }
 
 // Implemented as a pass through to support template functions
@@ -55,14 +59,10 @@ void reserveChildNames(ValidNameCache& cache, const UsdPrim& prim)
     reserveNames(cache, prim.GetAllChildrenNames());
 }
 
+// Read the children field directly rather than constructing a spec handle per child
 void reserveChildNames(ValidNameCache& cache, const SdfPrimSpecHandle parent)
 {
-    TfTokenVector names;
-    for (const auto& child : parent->GetNameChildren().values())
-    {
-        names.push_back(child->GetNameToken());
-    }
-    reserveNames(cache, names);
+    reserveNames(cache, parent->GetLayer()->GetFieldAs<TfTokenVector>(parent->GetPath(), SdfChildrenKeys->PrimChildren));
 }
 
 // Implemented as a pass through to support template functions
@@ -75,21 +75,127 @@ void reserveChildPropertyNames(ValidNameCache& cache, const UsdPrim& prim)
     reserveNames(cache, prim.GetPropertyNames());
 }
 
+// Read the children field directly rather than constructing a spec handle per property
 void reserveChildPropertyNames(ValidNameCache& cache, const SdfPrimSpecHandle parent)
 {
-    TfTokenVector names;
-    for (const auto& child : parent->GetProperties().values())
+    reserveNames(cache, parent->GetLayer()->GetFieldAs<TfTokenVector>(parent->GetPath(), SdfChildrenKeys->PropertyChildren));
+}
+
+//! Returns `name` with a numeric suffix appended, e.g. "foo_3"
+//!
+//! Avoids the printf style formatting of TfStringPrintf, as this is called for every name collision.
+//! The suffix is formatted into a stack buffer so the result is the only allocation.
+std::string getSuffixedName(const std::string& name, const size_t index)
+{
+    std::array<char, std::numeric_limits<size_t>::digits10 + 1> suffix;
+    const char* suffixEnd = std::to_chars(suffix.data(), suffix.data() + suffix.size(), index).ptr;
+    std::string result;
+    result.reserve(name.size() + 1 + static_cast<size_t>(suffixEnd - suffix.data()));
+    result.append(name);
+    result.push_back('_');
+    result.append(suffix.data(), suffixEnd);
+    return result;
+}
+
+//! Counts the requested names which have not been allocated yet, so that suffixed candidates can be checked against them without
+//! rescanning the remaining names for every candidate. The counts are only populated when the first suffixed candidate is checked.
+struct PendingNames
+{
+    const std::vector<std::string>& names;
+    std::unordered_map<std::string_view, size_t> counts;
+    bool populated;
+
+    PendingNames(const std::vector<std::string>& requestedNames) : names(requestedNames), populated(false)
     {
-        names.push_back(child->GetNameToken());
     }
-    reserveNames(cache, names);
-}
 
-TfTokenVector getValidNames(
-    const std::vector<std::string>& names,
-    std::function<const std::string(const std::string&)> getValidNameFunc,
-    ValidNameCache& cache
+    //! Remove the name at `nameIndex` as it is now being allocated
+    void pop(const size_t nameIndex)
+    {
+        if (populated)
+        {
+            --counts[names[nameIndex]];
+        }
+    }
+
+    //! Return true if `name` is requested after the name at `nameIndex`
+    bool contains(const size_t nameIndex, const std::string& name)
+    {
+        if (!populated)
+        {
+            for (size_t i = nameIndex + 1; i < names.size(); ++i)
+            {
+                ++counts[names[i]];
+            }
+            populated = true;
+        }
+        const auto it = counts.find(name);
+        return it != counts.end() && it->second > 0;
+    }
+};
+
+//! A function which makes a single name valid, e.g. `usdex::core::getValidPrimName`
+using ValidNameFunc = TfToken (*)(const std::string&);
+
+//! The minimum number of names validated by each parallel task. Batches no larger than this are validated serially.
+constexpr size_t g_validNamesGrainSize = 256;
+
+//! Allocates a unique name in `cache` for `originalName`, which has already been made valid as `validName`.
+//!
+//! If the valid name is already used a numeric suffix on the original name is incremented until an available one is found.
+//! Suffixed names for which `isPending` returns true are skipped, so they remain available to names that are requested later.
+template <class IsPendingFunc>
+TfToken allocateName(
+    const std::string& originalName,
+    const TfToken& validName,
+    ValidNameFunc getValidNameFunc,
+    ValidNameCache& cache,
+    const IsPendingFunc& isPending
 )
+{
+    TfToken name = validName;
+    size_t* index = nullptr;
+    while (true)
+    {
+        if (cache.usedNames.find(name) == cache.usedNames.end())
+        {
+            // Avoid allocating suffixed names that exist in the list of supplied names
+            // This increases the number of cases where the requested name is returned unchanged
+            if (name == validName || !isPending(name))
+            {
+                cache.usedNames.insert(name);
+                return name;
+            }
+        }
+
+        // Get the latest index for this name and build a new name.
+        // The lookup is only needed once per name as the reference remains valid while retrying.
+        if (index == nullptr)
+        {
+            index = &cache.startIndices[originalName];
+        }
+
+        (*index)++;
+        name = getValidNameFunc(getSuffixedName(originalName, *index));
+    }
+}
+
+//! Allocates a unique name in `cache` for a single requested name, without the bookkeeping required for a list of names
+TfToken getValidName(const std::string& name, ValidNameFunc getValidNameFunc, ValidNameCache& cache)
+{
+    return allocateName(
+        name,
+        getValidNameFunc(name),
+        getValidNameFunc,
+        cache,
+        [](const TfToken&)
+        {
+            return false;
+        }
+    );
+}
+
+TfTokenVector getValidNames(const std::vector<std::string>& names, ValidNameFunc getValidNameFunc, ValidNameCache& cache)
 {
     // Early exist if no names given.
     if (names.empty())
@@ -101,40 +207,46 @@ TfTokenVector getValidNames(
     TfTokenVector result;
     result.reserve(names.size());
 
-    // When requesting large amounts of child paths for the same base name cache the index so that names are not considered multiple times
-    std::unordered_map<std::string, size_t> startIndices;
+    // Each name is validated independently of the others, so large batches are made valid in parallel before checking uniqueness.
+    // Small batches are validated inline to avoid the temporary storage and task dispatch.
+    const bool validateInParallel = names.size() > g_validNamesGrainSize;
+    TfTokenVector validNames;
+    if (validateInParallel)
+    {
+        validNames.resize(names.size());
+        WorkParallelForN(
+            names.size(),
+            [&names, &validNames, getValidNameFunc](size_t begin, size_t end)
+            {
+                for (size_t i = begin; i < end; ++i)
+                {
+                    validNames[i] = getValidNameFunc(names[i]);
+                }
+            },
+            g_validNamesGrainSize
+        );
+    }
 
+    PendingNames pendingNames(names);
     for (size_t nameIndex = 0; nameIndex < names.size(); ++nameIndex)
     {
         // Keep the original name
         const std::string& originalName = names[nameIndex];
+        pendingNames.pop(nameIndex);
 
         // Make the name valid before checking uniqueness
-        const std::string validName = getValidNameFunc(originalName);
-
-        // Check if the valid name is already used. Increment a numeric suffix on the original name until an available one is found
-        std::string name = validName;
-        while (true)
-        {
-            const TfToken& nameToken = TfToken(name);
-            if (std::find(cache.usedNames.begin(), cache.usedNames.end(), nameToken) == cache.usedNames.end())
+        const TfToken validName = validateInParallel ? validNames[nameIndex] : getValidNameFunc(originalName);
+
+        result.push_back(allocateName(
+            originalName,
+            validName,
+            getValidNameFunc,
+            cache,
+            [&pendingNames, nameIndex](const TfToken& name)
             {
-                // Avoid allocating suffixed names that exist in the list of supplied names
-                // This increases the number of cases where the requested name is returned unchanged
-                if (name == validName || std::find(names.begin() + nameIndex + 1, names.end(), name) == names.end())
-                {
-                    result.push_back(nameToken);
-                    cache.usedNames.push_back(nameToken);
-                    break;
-                }
+                return pendingNames.contains(nameIndex, name.GetString());
             }
-
-            // Get the latest index for this name and build a new name.
-            size_t& index = cache.startIndices[originalName];
-
-            index++;
-            name = getValidNameFunc(TfStringPrintf("%s_%zu", originalName.c_str(), index));
-        }
+        ));
     }
 
     return result;
@@ -200,8 +312,7 @@ public:
             return TfToken();
         }
 
-        const TfTokenVector validNames = uncheckedGetPrimNames(parent, { name });
-        return validNames.size() > 0 ? validNames[0] : TfToken();
+        return getValidName(name, usdex::core::getValidPrimName, getPrimNameCache(parent));
     }
 
     template <class T>
@@ -213,7 +324,7 @@ public:
             TF_RUNTIME_ERROR("Unable to get prim names: %s", reason.c_str());
             return TfTokenVector();
         }
-        return uncheckedGetPrimNames(parent, names);
+        return getValidNames(names, usdex::core::getValidPrimName, getPrimNameCache(parent));
     }
 
     template <class T>
@@ -226,8 +337,7 @@ public:
             return TfToken();
         }
 
-        const TfTokenVector validNames = uncheckedGetPropertyNames(parent, { name });
-        return validNames.size() > 0 ? validNames[0] : TfToken();
+        return getValidName(name, usdex::core::getValidPropertyName, getPropertyNameCache(parent));
     }
 
     template <class T>
@@ -239,7 +349,7 @@ public:
             TF_RUNTIME_ERROR("Unable to get property names: %s", reason.c_str());
             return TfTokenVector();
         }
-        return uncheckedGetPropertyNames(parent, names);
+        return getValidNames(names, usdex::core::getValidPropertyName, getPropertyNameCache(parent));
     }
 
     template <class T>
@@ -252,7 +362,7 @@ public:
             return;
         }
 
-        auto insertIt = m_primNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertIt = m_primNameCache.try_emplace(getCacheKey(parent));
         reserveChildNames(insertIt.first->second, parent);
     }
 
@@ -266,7 +376,7 @@ public:
             return;
         }
 
-        auto insertIt = m_propertyNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertIt = m_propertyNameCache.try_emplace(getCacheKey(parent));
         reserveChildPropertyNames(insertIt.first->second, parent);
     }
 
@@ -280,10 +390,10 @@ public:
             return;
         }
 
-        auto insertPrimIt = m_primNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertPrimIt = m_primNameCache.try_emplace(getCacheKey(parent));
         reserveChildNames(insertPrimIt.first->second, parent);
 
-        auto insertPropertyIt = m_propertyNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertPropertyIt = m_propertyNameCache.try_emplace(getCacheKey(parent));
         reserveChildPropertyNames(insertPropertyIt.first->second, parent);
     }
 
@@ -451,14 +561,15 @@ private:
         return true;
     }
 
-    const SdfPath getCacheKey(const SdfPath& parent)
+    // Return paths by reference where possible to avoid reference counting a copy on each request
+    const SdfPath& getCacheKey(const SdfPath& parent)
     {
         return parent;
     }
 
-    const SdfPath getCacheKey(const UsdPrim& parent)
+    const SdfPath& getCacheKey(const UsdPrim& parent)
     {
-        return parent.GetPath();
+        return parent.GetPrimPath();
     }
 
     const SdfPath getCacheKey(const SdfPrimSpecHandle parent)
@@ -467,29 +578,29 @@ private:
     }
 
     template <class T>
-    TfTokenVector uncheckedGetPrimNames(const T& parent, const std::vector<std::string>& names)
+    ::ValidNameCache& getPrimNameCache(const T& parent)
     {
-        auto insertIt = m_primNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertIt = m_primNameCache.try_emplace(getCacheKey(parent));
         if (insertIt.second)
         {
             reserveChildNames(insertIt.first->second, parent);
         }
-        return getValidNames(names, usdex::core::getValidPrimName, insertIt.first->second);
+        return insertIt.first->second;
     }
 
     template <class T>
-    TfTokenVector uncheckedGetPropertyNames(const T& parent, const std::vector<std::string>& names)
+    ::ValidNameCache& getPropertyNameCache(const T& parent)
     {
-        auto insertIt = m_propertyNameCache.insert(std::make_pair(getCacheKey(parent), ::ValidNameCache()));
+        auto insertIt = m_propertyNameCache.try_emplace(getCacheKey(parent));
         if (insertIt.second)
         {
             reserveChildPropertyNames(insertIt.first->second, parent);
         }
-        return getValidNames(names, usdex::core::getValidPropertyName, insertIt.first->second);
+        return insertIt.first->second;
     }
 
-    std::map<SdfPath, ::ValidNameCache> m_primNameCache;
-    std::map<SdfPath, ::ValidNameCache> m_propertyNameCache;
+    std::unordered_map<SdfPath, ::ValidNameCache, SdfPath::Hash> m_primNameCache;
+    std::unordered_map<SdfPath, ::ValidNameCache, SdfPath::Hash> m_propertyNameCache;
 };
 
 usdex::core::NameCache::NameCache() : m_impl(new NameCacheImpl)
@@ -650,7 +761,7 @@ public:
 
     TfTokenVector getValidChildNames(const UsdPrim& prim, const std::vector<std::string>& names)
     {
-        auto insertIt = m_cache.insert(std::make_pair(prim.GetPath(), ValidNameCache()));
+        auto insertIt = m_cache.try_emplace(prim.GetPath());
 
         // If the insert succeeded it is a new cache entry so we need to reserve the existing child names
         if (insertIt.second)
@@ -670,7 +781,7 @@ public:
 
     void update(const UsdPrim& prim)
     {
-        auto insertIt = m_cache.insert(std::make_pair(prim.GetPath(), ValidNameCache()));
+        auto insertIt = m_cache.try_emplace(prim.GetPath());
         reserveChildNames(insertIt.first->second, prim);
     }
 
@@ -681,7 +792,7 @@ public:
 
 private:
 
-    std::map<SdfPath, ValidNameCache> m_cache;
+    std::unordered_map<SdfPath, ValidNameCache, SdfPath::Hash> m_cache;
 };
 
 usdex::core::ValidChildNameCache::ValidChildNameCache() : m_impl(new CacheImpl)
@@ -715,26 +826,23 @@ void usdex::core::ValidChildNameCache::clear(const UsdPrim& prim)
 
 TfToken usdex::core::getValidPropertyName(const std::string& name)
 {
-    // Split the name based on the ":" delimiter
-    std::vector<std::string> tokens = TfStringSplit(name, ":");
-
-    // Add an empty token if the original name produced no tokens.
-    // This is most likely to occur if the incoming name was empty.
-    if (tokens.empty())
-    {
-        tokens.push_back("");
-    }
-
-    // Make each token a valid identifier using bootstring encoding
-    std::vector<std::string> validTokens;
-    validTokens.reserve(tokens.size());
-    for (const std::string& token : tokens)
+    // Make each namespace between ":" delimiters a valid identifier using bootstring encoding, appending the results directly.
+    // Delimiters imply an empty namespace before, after and between them, and an empty name is a single empty namespace.
+    std::string result;
+    result.reserve(name.size());
+    size_t start = 0;
+    while (true)
     {
-        validTokens.push_back(usdex::core::detail::makeValidIdentifier(token));
+        const size_t end = name.find(':', start);
+        result.append(usdex::core::detail::makeValidIdentifier(name.substr(start, end - start)));
+        if (end == std::string::npos)
+        {
+            break;
+        }
+        result.push_back(':');
+        start = end + 1;
     }
-
-    // Join the namespaces again using the ":" delimiter
-    return TfToken(TfStringJoin(validTokens, ":"));
+    return TfToken(result);
 }
 
 TfTokenVector usdex::core::getValidPropertyNames(const std::vector<std::string>& names, const TfTokenVector& reservedNames)
@@ -6,6 +6,7 @@
 
 #include "usdex/core/StageAlgo.h"
 
+#include <pxr/base/tf/staticTokens.h>
 #include <pxr/usd/usdPhysics/materialAPI.h>
 #include <pxr/usd/usdPhysics/tokens.h>
 #include <pxr/usd/usdShade/materialBindingAPI.h>
@@ -14,6 +15,21 @@
 
 using namespace pxr;
 
+namespace
+{
+
+// Warnings generated by USD 23.11
+#if defined(ARCH_OS_WINDOWS) && PXR_VERSION < 2405
+#pragma warning(push)
+#pragma warning(disable : 4003) // not enough arguments for function-like macro invocation
+TF_DEFINE_PRIVATE_TOKENS(_tokens, (physics));
+#pragma warning(pop)
+#else
+TF_DEFINE_PRIVATE_TOKENS(_tokens, (physics));
+#endif
+
+} // namespace
+
 UsdShadeMaterial usdex::core::definePhysicsMaterial(
     UsdStagePtr stage,
     const SdfPath& path,
@@ -153,7 +169,7 @@ bool usdex::core::bindPhysicsMaterial(UsdPrim prim, const UsdShadeMaterial& mate
     }
 
     auto materialBindingAPI = UsdShadeMaterialBindingAPI::Apply(prim);
-    if (!materialBindingAPI.Bind(material, UsdShadeTokens->fallbackStrength, TfToken("physics")))
+    if (!materialBindingAPI.Bind(material, UsdShadeTokens->fallbackStrength, _tokens->physics))
     {
         TF_RUNTIME_ERROR("Unable to bind physics material to prim: %s", prim.GetPath().GetAsString().c_str());
         return false;
@@ -83,6 +83,11 @@ std::string usdex::core::detail::makeValidIdentifier(const std::string& in)
     }
     else
     {
+        // Identifiers which are already valid are returned unchanged, without copying them through character substitution
+        if (usdex::core::detail::isASCIIIdentifier(in))
+        {
+            return in;
+        }
         return makeValidIdentifierExtended(in);
     }
 }
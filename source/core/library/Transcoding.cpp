@@ -14,6 +14,7 @@
 #include <limits>
 #include <optional>
 #include <random>
+#include <string>
 #include <tuple>
 #include <unordered_set>
 #include <vector>
@@ -171,16 +172,41 @@ struct BinaryIndexedTree
 
 // Format functions
 
+//! Bit flags describing how a byte may be used within an ASCII identifier
+constexpr unsigned char ASCII_START = 1 << 0;
+constexpr unsigned char ASCII_CONTINUE = 1 << 1;
+
+//! Builds a table of ASCII identifier flags indexed by byte value
+constexpr std::array<unsigned char, 256> makeASCIIIdentifierTable()
+{
+    std::array<unsigned char, 256> table{};
+    for (size_t value = 0; value < table.size(); ++value)
+    {
+        if ((value >= 'A' && value <= 'Z') || (value == '_') || (value >= 'a' && value <= 'z'))
+        {
+            table[value] = ASCII_START | ASCII_CONTINUE;
+        }
+        else if (value >= '0' && value <= '9')
+        {
+            table[value] = ASCII_CONTINUE;
+        }
+    }
+    return table;
+}
+
+//! Classifies characters with a single lookup rather than a chain of range comparisons
+constexpr std::array<unsigned char, 256> ASCII_IDENTIFIER_TABLE = makeASCIIIdentifierTable();
+
 /// Equivalent to TfIsUtf8CodePointXidStart, but for ASCII characters.
 bool IsASCIIStart(const uint32_t value)
 {
-    return ((value >= 'A' && value <= 'Z') || (value == '_') || (value >= 'a' && value <= 'z'));
+    return value < ASCII_IDENTIFIER_TABLE.size() && (ASCII_IDENTIFIER_TABLE[value] & ASCII_START) != 0;
 }
 
 /// Equivalent to TfIsUtf8CodePointXidContinue, but for ASCII characters.
 bool IsASCIIContinue(const uint32_t value)
 {
-    return ((value >= '0' && value <= '9') || (value >= 'A' && value <= 'Z') || (value == '_') || (value >= 'a' && value <= 'z'));
+    return value < ASCII_IDENTIFIER_TABLE.size() && (ASCII_IDENTIFIER_TABLE[value] & ASCII_CONTINUE) != 0;
 }
 
 bool IsStart(const TfUtf8CodePoint value, const usdex::core::detail::TranscodingFormat format)
@@ -211,18 +237,47 @@ bool IsContinue(const TfUtf8CodePoint value, const usdex::core::detail::Transcod
 
 // Bootstring
 
+//! Appends the UTF-8 encoding of `value` to string `out`.
+//! Equivalent to streaming a TfUtf8CodePoint, without the overhead of an output stream.
+void appendCodePoint(std::string& out, const TfUtf8CodePoint value)
+{
+    const code_t codePoint = value.AsUInt32();
+    if (codePoint < 0x80)
+    {
+        out.push_back(static_cast<char>(codePoint));
+    }
+    else if (codePoint < 0x800)
+    {
+        out.push_back(static_cast<char>(0xC0 | (codePoint >> 6)));
+        out.push_back(static_cast<char>(0x80 | (codePoint & 0x3F)));
+    }
+    else if (codePoint < 0x10000)
+    {
+        out.push_back(static_cast<char>(0xE0 | (codePoint >> 12)));
+        out.push_back(static_cast<char>(0x80 | ((codePoint >> 6) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | (codePoint & 0x3F)));
+    }
+    else
+    {
+        out.push_back(static_cast<char>(0xF0 | (codePoint >> 18)));
+        out.push_back(static_cast<char>(0x80 | ((codePoint >> 12) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | ((codePoint >> 6) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | (codePoint & 0x3F)));
+    }
+}
+
 //! Encodes variable length integers `number` and appends it to string `out`.
-void encodeVariableLength(std::ostringstream& oss, uint64_t number)
+void encodeVariableLength(std::string& out, uint64_t number)
 {
     base62_t threshold = BOOTSTRING_THRESHOLD;
     while (number >= threshold)
     {
         const base62_t digit = threshold + static_cast<base62_t>((number - threshold) % (BASE62 - threshold));
-        oss << encodeBase62(digit);
+        out.push_back(encodeBase62(digit));
         number = (number - threshold) / (BASE62 - threshold);
     }
     // number < threshold
-    oss << encodeBase62(static_cast<base62_t>(number));
+    out.push_back(encodeBase62(static_cast<base62_t>(number)));
 }
 
 //! Decodes variable length integers starting at index.
@@ -277,7 +332,8 @@ std::optional<uint64_t> decodeVariableLength(TfUtf8CodePointIterator& it)
 
 std::optional<std::string> encodeBootstring(const std::string& inputString, const usdex::core::detail::TranscodingFormat format)
 {
-    std::ostringstream oss;
+    std::string output;
+    output.reserve(inputString.size() + 1);
     size_t numberCodePoints = 0;
     for (const TfUtf8CodePoint value : TfUtf8CodePointView{ inputString })
     {
@@ -287,14 +343,14 @@ std::optional<std::string> encodeBootstring(const std::string& inputString, cons
         }
         if (IsContinue(value, format))
         {
-            oss << TfUtf8CodePoint(value);
+            appendCodePoint(output, value);
         }
         ++numberCodePoints;
     }
 
-    if (oss.tellp() > 0)
+    if (!output.empty())
     {
-        oss << BOOTSTRING_DELIMITER;
+        output.push_back(BOOTSTRING_DELIMITER);
     }
 
     BinaryIndexedTree tree(numberCodePoints);
@@ -331,14 +387,14 @@ std::optional<std::string> encodeBootstring(const std::string& inputString, cons
             return std::nullopt;
         }
         delta += (codePoint - prevCodePoint) * (encodedPoints + 1);
-        encodeVariableLength(oss, delta);
+        encodeVariableLength(output, delta);
         prevCodePoint = codePoint;
 
         tree.increase(codePosition);
         ++encodedPoints;
     }
 
-    return oss.str();
+    return output;
 }
 
 std::optional<std::string> decodeBootstring(const std::string& inputString)
@@ -414,17 +470,41 @@ std::optional<std::string> decodeBootstring(const std::string& inputString)
         codePoints[index] = value;
         tree.decrease(index);
     }
-    std::ostringstream oss;
+    std::string output;
+    output.reserve(inputString.size());
     for (const auto codePoint : codePoints)
     {
-        oss << TfUtf8CodePoint(codePoint);
+        appendCodePoint(output, TfUtf8CodePoint(codePoint));
     }
-    return oss.str();
+    return output;
 }
 } // namespace
 
+bool usdex::core::detail::isASCIIIdentifier(const std::string& inputString)
+{
+    if (inputString.empty() || !IsASCIIStart(static_cast<unsigned char>(inputString[0])))
+    {
+        return false;
+    }
+    return std::all_of(
+        inputString.begin() + 1,
+        inputString.end(),
+        [](const char character)
+        {
+            return IsASCIIContinue(static_cast<unsigned char>(character));
+        }
+    );
+}
+
 std::string usdex::core::detail::encodeIdentifier(const std::string& inputString, const usdex::core::detail::TranscodingFormat format)
 {
+    // Most identifiers are already valid ASCII identifiers. Detect them with a single pass over the bytes rather than
+    // decoding code points, building the Bootstring output, and comparing it to the input.
+    if (usdex::core::detail::isASCIIIdentifier(inputString))
+    {
+        return inputString;
+    }
+
     std::optional<std::string> ret = encodeBootstring(inputString, format);
     if (!ret)
     {
@@ -432,29 +512,27 @@ std::string usdex::core::detail::encodeIdentifier(const std::string& inputString
         return "";
     }
     const std::string& output = *ret;
+
+    // The output is unchanged when it is the input followed by the delimiter. Compare in place to avoid building a temporary string.
+    const bool unchanged = output.size() == inputString.size() + 1 && output.back() == BOOTSTRING_DELIMITER &&
+                           output.compare(0, inputString.size(), inputString) == 0;
+    if (unchanged && IsStart(*TfUtf8CodePointView{ inputString }.begin(), format))
+    {
+        return inputString;
+    }
+
     std::string result;
+    result.reserve(BOOTSTRING_PREFIX.size() + output.size());
     result.append(BOOTSTRING_PREFIX);
     result.append(output);
-    if (output == inputString + BOOTSTRING_DELIMITER) // i.e. unchanged.
-    {
-        const auto it = TfUtf8CodePointView{ inputString }.begin();
-        if (IsStart(*it, format))
-        {
-            return inputString;
-        }
-        else
-        {
-            return result;
-        }
-    }
     return result;
 }
 
 std::string usdex::core::detail::decodeIdentifier(const std::string& inputString)
 {
-    if (inputString.substr(0, 4) == BOOTSTRING_PREFIX)
+    if (inputString.compare(0, BOOTSTRING_PREFIX.size(), BOOTSTRING_PREFIX) == 0)
     {
-        const std::string substr = inputString.substr(4, inputString.size() - 1);
+        const std::string substr = inputString.substr(BOOTSTRING_PREFIX.size());
         const std::optional<std::string> ret = decodeBootstring(substr);
         if (!ret)
         {
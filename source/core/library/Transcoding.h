@@ -20,6 +20,13 @@ enum class TranscodingFormat
     UTF8_XID
 };
 
+//! Returns true if `inputString` is a non-empty identifier composed only of ASCII alphanumerics and underscores, which does not start with a digit.
+//!
+//! Such identifiers are valid in every TranscodingFormat and are returned unchanged by `encodeIdentifier`.
+//!
+//! @param inputString The input string
+bool isASCIIIdentifier(const std::string& inputString);
+
 //! Encodes an identifier using the Bootstring algorithm.
 //! For more information see [Encoding
 //! Procedure](https://github.com/PixarAnimationStudios/OpenUSD-proposals/tree/main/proposals/transcoding_invalid_identifiers#encoding-procedure)
@@ -12,6 +12,23 @@ import usdex.test
 from pxr import Gf, Sdf, Tf, Usd, UsdGeom, UsdShade, UsdUtils
 
 
+# sRGB reference colors paired index-wise with their expected linear equivalents
+SRGB_REFS = (
+    Gf.Vec3f(0.5, 0.5, 0.5),
+    Gf.Vec3f(0.33, 0.1, 0.1),
+    Gf.Vec3f(0.67, 0.97, 0.67),
+    Gf.Vec3f(0.45, 0.2, 0.6),
+    Gf.Vec3f(0.03, 0.03, 0.03),
+)
+LINEAR_REFS = (
+    Gf.Vec3f(0.21404114, 0.21404114, 0.21404114),
+    Gf.Vec3f(0.0889815256, 0.01002282, 0.01002282),
+    Gf.Vec3f(0.406448301, 0.93310684, 0.406448301),
+    Gf.Vec3f(0.17064493, 0.033104767, 0.3185467781),
+    Gf.Vec3f(0.0023219814, 0.0023219814, 0.0023219814),
+)
+
+
 class MaterialAlgoTest(usdex.test.TestCase):
 
     def testCreateMaterial(self):
@@ -152,65 +169,16 @@ class MaterialAlgoTest(usdex.test.TestCase):
         self.assertEqual(usdex.core.getColorSpaceToken(usdex.core.ColorSpace.eSrgb), "sRGB")
 
     def testColorSpaceConversions(self):
-        greySrgb = Gf.Vec3f(0.5, 0.5, 0.5)
-        darkRedSrgb = Gf.Vec3f(0.33, 0.1, 0.1)
-        lightGreenSrgb = Gf.Vec3f(0.67, 0.97, 0.67)
-        purpleSrgb = Gf.Vec3f(0.45, 0.2, 0.6)
-        blackSrgb = Gf.Vec3f(0.03, 0.03, 0.03)
-
-        greyLinear = Gf.Vec3f(0.21404114, 0.21404114, 0.21404114)
-        darkRedLinear = Gf.Vec3f(0.0889815256, 0.01002282, 0.01002282)
-        lightGreenLinear = Gf.Vec3f(0.406448301, 0.93310684, 0.406448301)
-        purpleLinear = Gf.Vec3f(0.17064493, 0.033104767, 0.3185467781)
-        blackLinear = Gf.Vec3f(0.0023219814, 0.0023219814, 0.0023219814)
-
-        convertedGreyLinear = usdex.core.sRgbToLinear(greySrgb)
-        convertedDarkRedLinear = usdex.core.sRgbToLinear(darkRedSrgb)
-        convertedLightGreenLinear = usdex.core.sRgbToLinear(lightGreenSrgb)
-        convertedPurpleLinear = usdex.core.sRgbToLinear(purpleSrgb)
-        convertedBlackLinear = usdex.core.sRgbToLinear(blackSrgb)
-
-        convertedGreySrgb = usdex.core.linearToSrgb(greyLinear)
-        convertedDarkRedSrgb = usdex.core.linearToSrgb(darkRedLinear)
-        convertedLightGreenSrgb = usdex.core.linearToSrgb(lightGreenLinear)
-        convertedPurpleSrgb = usdex.core.linearToSrgb(purpleLinear)
-        convertedBlackSrgb = usdex.core.linearToSrgb(blackLinear)
-
-        roundTripGreySrgb = usdex.core.linearToSrgb(convertedGreyLinear)
-        roundTripRedSrgb = usdex.core.linearToSrgb(convertedDarkRedLinear)
-        roundTripGreenSrgb = usdex.core.linearToSrgb(convertedLightGreenLinear)
-        roundTripPurpleSrgb = usdex.core.linearToSrgb(convertedPurpleLinear)
-        roundTripBlackSrgb = usdex.core.linearToSrgb(convertedBlackLinear)
-
-        roundTripGreyLinear = usdex.core.sRgbToLinear(convertedGreySrgb)
-        roundTripRedLinear = usdex.core.sRgbToLinear(convertedDarkRedSrgb)
-        roundTripGreenLinear = usdex.core.sRgbToLinear(convertedLightGreenSrgb)
-        roundTripPurpleLinear = usdex.core.sRgbToLinear(convertedPurpleSrgb)
-        roundTripBlackLinear = usdex.core.sRgbToLinear(convertedBlackSrgb)
-
-        self.assertVecAlmostEqual(convertedGreyLinear, greyLinear, places=6)
-        self.assertVecAlmostEqual(convertedDarkRedLinear, darkRedLinear, places=6)
-        self.assertVecAlmostEqual(convertedLightGreenLinear, lightGreenLinear, places=6)
-        self.assertVecAlmostEqual(convertedPurpleLinear, purpleLinear, places=6)
-        self.assertVecAlmostEqual(convertedBlackLinear, blackLinear, places=6)
-
-        self.assertVecAlmostEqual(convertedGreySrgb, greySrgb, places=6)
-        self.assertVecAlmostEqual(convertedDarkRedSrgb, darkRedSrgb, places=6)
-        self.assertVecAlmostEqual(convertedLightGreenSrgb, lightGreenSrgb, places=6)
-        self.assertVecAlmostEqual(convertedPurpleSrgb, purpleSrgb, places=6)
-        self.assertVecAlmostEqual(convertedBlackSrgb, blackSrgb, places=6)
-
-        self.assertVecAlmostEqual(roundTripGreyLinear, greyLinear, places=6)
-        self.assertVecAlmostEqual(roundTripRedLinear, darkRedLinear, places=6)
-        self.assertVecAlmostEqual(roundTripGreenLinear, lightGreenLinear, places=6)
-        self.assertVecAlmostEqual(roundTripPurpleLinear, purpleLinear, places=6)
-        self.assertVecAlmostEqual(roundTripBlackLinear, blackLinear, places=6)
-
-        self.assertVecAlmostEqual(roundTripGreySrgb, greySrgb, places=6)
-        self.assertVecAlmostEqual(roundTripRedSrgb, darkRedSrgb, places=6)
-        self.assertVecAlmostEqual(roundTripGreenSrgb, lightGreenSrgb, places=6)
-        self.assertVecAlmostEqual(roundTripPurpleSrgb, purpleSrgb, places=6)
-        self.assertVecAlmostEqual(roundTripBlackSrgb, blackSrgb, places=6)
+        for srgb, linear in zip(SRGB_REFS, LINEAR_REFS):
+            with self.subTest(srgb=srgb, linear=linear):
+                convertedLinear = usdex.core.sRgbToLinear(srgb)
+                convertedSrgb = usdex.core.linearToSrgb(linear)
+                self.assertVecAlmostEqual(convertedLinear, linear, places=6)
+                self.assertVecAlmostEqual(convertedSrgb, srgb, places=6)
+
+                # round trips return to the original color space
+                self.assertVecAlmostEqual(usdex.core.sRgbToLinear(convertedSrgb), linear, places=6)
+                self.assertVecAlmostEqual(usdex.core.linearToSrgb(convertedLinear), srgb, places=6)
 
     def testAddPreviewMaterialInterface(self):
         stage = Usd.Stage.CreateInMemory()
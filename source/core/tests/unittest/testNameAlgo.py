@@ -6,6 +6,12 @@ import usdex.core
 import usdex.test
 from pxr import Sdf, Tf, Usd, UsdGeom
 
+BOOL_TYPE = Sdf.ValueTypeNames.Bool
+
+# Batches of more than 256 names are made valid in parallel before their uniqueness is resolved
+LARGE_BATCH_GROUP_COUNT = 120
+LARGE_BATCH_SIZE = LARGE_BATCH_GROUP_COUNT * 5
+
 
 class TranscodingTestCase(usdex.test.TestCase):
     def testEncodeEmpty(self):
@@ -112,9 +118,12 @@ class TranscodingTestCase(usdex.test.TestCase):
 
 
 class ValidPrimNamesTestCase(usdex.test.TestCase):
+    # The prim path used to validate property names, built once rather than for every name
+    propertyParentPath = Sdf.Path("/foo")
+
     def assertPropertyNameIsValid(self, name, msg=None):
         """Assert that the given name is valid for a UsdProperty"""
-        path = Sdf.Path("/foo").AppendProperty(name)
+        path = self.propertyParentPath.AppendProperty(name)
         if msg is None:
             msg = f"Appending '{name}' as a property of an SdfPath produces an invalid path."
         self.assertTrue(path, msg=msg)
@@ -145,8 +154,8 @@ class ValidPrimNamesTestCase(usdex.test.TestCase):
 
         # ISO-8859-1 encoding will cause encoding to fail resulting in the fallback character substitution being used.
         # The fallback character substitution slightly differs from pxr::TfMakeValidIdentifier in how it handles leading numerics
-        self.assertEqual(usdex.core.getValidPrimName("mesh_Ä".encode("latin-1")), "mesh__")
-        self.assertEqual(usdex.core.getValidPrimName("1_Ä".encode("latin-1")), "_1__")
+        self.assertEqual(usdex.core.getValidPrimName(b"mesh_\xc4"), "mesh__")
+        self.assertEqual(usdex.core.getValidPrimName(b"1_\xc4"), "_1__")
 
     def testGetValidPrimNames(self):
         def assertEqualPrimNames(inputNames, reservedNames, expectNames):
@@ -197,11 +206,41 @@ class ValidPrimNamesTestCase(usdex.test.TestCase):
         # ISO-8859-1 encoding will cause encoding to fail resulting in the fallback character substitution being used.
         # This can increase the number of name collisions.
         assertEqualPrimNames(
-            [x.encode("latin-1") for x in ["mesh_Ä", "mesh-Ä", "mesh/Ä", "mesh.Ä"]],
+            [b"mesh_\xc4", b"mesh-\xc4", b"mesh/\xc4", b"mesh.\xc4"],
             [],
             ["mesh__", "mesh___1", "mesh___2", "mesh___3"],
         )
 
+    def testGetValidPrimNamesLargeBatch(self):
+        # Names which are unique once made valid are returned exactly as getValidPrimName returns them one at a time
+        names = [f"cube{i}" if i % 3 == 0 else f"{i} cube/{i}" if i % 3 == 1 else b"cube%d_\xc4" % i for i in range(LARGE_BATCH_SIZE)]
+        with usdex.test.ScopedDiagnosticChecker(self, []):
+            returned = usdex.core.getValidPrimNames(names, [])
+        self.assertEqual(returned, [usdex.core.getValidPrimName(name) for name in names])
+
+        # Duplicates, invalid characters and reserved names only collide within each group of names,
+        # so the batch is resolved exactly as if each group were requested on its own
+        groups = [[f"cube{i}", f"cube{i}", f"{i} cube", f"cube{i}_1", b"cube%d_\xc4" % i] for i in range(LARGE_BATCH_GROUP_COUNT)]
+        reservedGroups = [[f"cube{i}_1", f"cube{i}__"] for i in range(LARGE_BATCH_GROUP_COUNT)]
+        names = [name for group in groups for name in group]
+        reservedNames = [name for group in reservedGroups for name in group]
+        self.assertEqual(len(names), LARGE_BATCH_SIZE)
+        expected = [name for group, reserved in zip(groups, reservedGroups) for name in usdex.core.getValidPrimNames(group, reserved)]
+        with usdex.test.ScopedDiagnosticChecker(self, []):
+            returned = usdex.core.getValidPrimNames(names, reservedNames)
+        self.assertEqual(returned, expected)
+        self.assertEqual(len(set(returned)), LARGE_BATCH_SIZE)
+
+        # The same holds when the reserved names are existing children of a prim
+        stage = Usd.Stage.CreateInMemory()
+        prim = UsdGeom.Xform.Define(stage, "/Root").GetPrim()
+        for name in reservedNames:
+            UsdGeom.Xform.Define(stage, prim.GetPath().AppendChild(name))
+        expected = [name for group in groups for name in usdex.core.getValidChildNames(prim, group)]
+        with usdex.test.ScopedDiagnosticChecker(self, []):
+            returned = usdex.core.getValidChildNames(prim, names)
+        self.assertEqual(returned, expected)
+
     def testGetValidChildName(self):
         # Define a prim for which we will get a valid child name
         stage = Usd.Stage.CreateInMemory()
@@ -372,8 +411,9 @@ class ValidPrimNamesTestCase(usdex.test.TestCase):
             self.assertEqual(len(names), len(returned), msg=msg)
 
             # There should never be any duplicates in the return
+            returnedNames = set(returned)
             msg = f"Duplicate names produced calling getValidPropertyName({str(names)}, reservedNames={str(reservedNames)})"
-            self.assertTrue((len(returned) == len(set(returned))), msg=msg)
+            self.assertTrue((len(returned) == len(returnedNames)), msg=msg)
 
             # The result should match
             msg = f"Unexpected result calling getValidPropertyName({str(names)}, reservedNames={str(reservedNames)})"
@@ -382,13 +422,35 @@ class ValidPrimNamesTestCase(usdex.test.TestCase):
             # None of the reserved names should have been returned
             for name in reservedNames:
                 msg = f"Reserved name returned when calling getValidPropertyName({str(names)}, reservedNames={str(reservedNames)})"
-                self.assertNotIn(name, returned, msg=msg)
+                self.assertNotIn(name, returnedNames, msg=msg)
 
             # Each name returned should be valid for a property name
             for name in returned:
                 msg = f"Invalid property name '{name}' returned when calling getValidPropertyName({str(names)}, reservedNames={str(reservedNames)})"
                 self.assertPropertyNameIsValid(name, msg=msg)
 
+    def testGetValidPropertyNamesLargeBatch(self):
+        # Names which are unique once made valid are returned exactly as getValidPropertyName returns them one at a time
+        names = [f"foo{i}" if i % 3 == 0 else f"{i} foo:bar/{i}" if i % 3 == 1 else f"foo:bar{i}" for i in range(LARGE_BATCH_SIZE)]
+        with usdex.test.ScopedDiagnosticChecker(self, []):
+            returned = usdex.core.getValidPropertyNames(names, reservedNames=[])
+        self.assertEqual(returned, [usdex.core.getValidPropertyName(name) for name in names])
+
+        # Duplicates, invalid characters and reserved names only collide within each group of names,
+        # so the batch is resolved exactly as if each group were requested on its own
+        groups = [[f"g{i}:foo", f"g{i}:foo", f"g{i}:foo bar", f"{i}_foo:bar", f"g{i}:foo_1"] for i in range(LARGE_BATCH_GROUP_COUNT)]
+        reservedGroups = [[f"g{i}:foo_1", f"g{i}:foo_2"] for i in range(LARGE_BATCH_GROUP_COUNT)]
+        names = [name for group in groups for name in group]
+        reservedNames = [name for group in reservedGroups for name in group]
+        self.assertEqual(len(names), LARGE_BATCH_SIZE)
+        expected = [
+            name for group, reserved in zip(groups, reservedGroups) for name in usdex.core.getValidPropertyNames(group, reservedNames=reserved)
+        ]
+        with usdex.test.ScopedDiagnosticChecker(self, []):
+            returned = usdex.core.getValidPropertyNames(names, reservedNames=reservedNames)
+        self.assertEqual(returned, expected)
+        self.assertEqual(len(set(returned)), LARGE_BATCH_SIZE)
+
     def testGetValidPropertyNamesForMultiApplySchema(self):
         # The getValidPropertyNames() function can be used to get valid and unique names that can be used with multi-apply schema
 
@@ -407,22 +469,30 @@ class ValidPrimNamesTestCase(usdex.test.TestCase):
         # Assert the expected collection names
         self.assertEqual(set(getAllCollectionNames(prim)), set(["foo", "bar"]))
 
+        # Query the existing collection names once and keep them up to date as new collections are applied
+        # This avoids re-querying every collection on the prim for each batch of names
+        collectionNames = set(getAllCollectionNames(prim))
+
         # With the existing collection names reserved apply the same named collections again
         # The names will be made unique and valid and the new collections will not collide
         names = ["foo", "bar"]
-        for name in usdex.core.getValidPropertyNames(names, reservedNames=getAllCollectionNames(prim)):
+        for name in usdex.core.getValidPropertyNames(names, reservedNames=list(collectionNames)):
             Usd.CollectionAPI.Apply(prim, name)
+            collectionNames.add(name)
 
         # Assert the expected collection names
         self.assertEqual(set(getAllCollectionNames(prim)), set(["foo", "bar", "foo_1", "bar_1"]))
+        self.assertEqual(collectionNames, set(getAllCollectionNames(prim)))
 
         # Apply some collections with names that are illegal for properties
         names = ["😍.😸", "Bäcker", "foo bar"]
-        for name in usdex.core.getValidPropertyNames(names, reservedNames=getAllCollectionNames(prim)):
+        for name in usdex.core.getValidPropertyNames(names, reservedNames=list(collectionNames)):
             Usd.CollectionAPI.Apply(prim, name)
+            collectionNames.add(name)
 
         # Assert the expected collection names
         self.assertEqual(set(getAllCollectionNames(prim)), set(["foo", "bar", "foo_1", "bar_1", "tn__foobar_f6", "tn__Bcker_ah0", "tn__k0zfn7c3"]))
+        self.assertEqual(collectionNames, set(getAllCollectionNames(prim)))
 
 
 class ValidChildNameCacheTestCase(usdex.test.TestCase):
@@ -484,26 +554,25 @@ class NameCacheTestCase(usdex.test.TestCase):
         self.nameCache = usdex.core.NameCache()
 
     def assertInvalidPathParentArg(self, func, args, result, msg, root):
-        # A non-absolute SdfPath cannot be used as a stable cache key, so will return an invalid token
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path(), *args), result)
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path("relative/path"), *args), result)
-
-        # A non-prim SdfPath cannot be used as a meaningful cache key, so will return an invalid token
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path("/path.property"), *args), result)
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path(".property"), *args), result)
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path("/foo{color=red}"), *args), result)
-        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-            self.assertEqual(func(Sdf.Path("/foo{color=red}bar"), *args), result)
+        invalidPaths = [
+            # A non-absolute SdfPath cannot be used as a stable cache key, so will return an invalid token
+            Sdf.Path(),
+            Sdf.Path("relative/path"),
+            # A non-prim SdfPath cannot be used as a meaningful cache key, so will return an invalid token
+            Sdf.Path("/path.property"),
+            Sdf.Path(".property"),
+            Sdf.Path("/foo{color=red}"),
+            Sdf.Path("/foo{color=red}bar"),
+        ]
 
         # The absolute root path is not valid for some functions because it cannot have properties
         if not root:
-            with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)]):
-                self.assertEqual(func(Sdf.Path.absoluteRootPath, *args), result)
+            invalidPaths.append(Sdf.Path.absoluteRootPath)
+
+        # Each invalid path reports a single runtime error, so they can all be checked within one diagnostic scope
+        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_RUNTIME_ERROR_TYPE, msg)] * len(invalidPaths)):
+            for path in invalidPaths:
+                self.assertEqual(func(path, *args), result)
 
     def assertInvalidPrimParentArg(self, func, args, result, msg, root):
         # An invalid UsdPrim does not have a path that can be used as a stable cache key, so will return an invalid token
@@ -696,9 +765,9 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Existing property names are reserved regardless of them being relationships, attributes, authored, un-authored or blocked.
         parent: Usd.Prim = self.stage.DefinePrim(Sdf.Path("/prim"))
         parent.CreateRelationship("foo")
-        parent.CreateAttribute("foo_1", Sdf.ValueTypeNames.Bool)
-        parent.CreateAttribute("foo_2", Sdf.ValueTypeNames.Bool).Set(False)
-        parent.CreateAttribute("foo_3", Sdf.ValueTypeNames.Bool).Block()
+        parent.CreateAttribute("foo_1", BOOL_TYPE)
+        parent.CreateAttribute("foo_2", BOOL_TYPE).Set(False)
+        parent.CreateAttribute("foo_3", BOOL_TYPE).Block()
         self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo_4")
 
         # However property names are not reserved if the path exists in the NameCache before the properties are defined
@@ -716,11 +785,13 @@ class NameCacheTestCase(usdex.test.TestCase):
 
         # If an SdfPrimSpec has existing children, then those names will be reserved when the names for that path are requested
         # Existing child prim names are reserved regardless of specifier or active state.
-        parent: Sdf.PrimSpec = Sdf.CreatePrimInLayer(self.layer, Sdf.Path("/primSpec"))
-        Sdf.RelationshipSpec(parent, "foo")
-        Sdf.AttributeSpec(parent, "foo_1", Sdf.ValueTypeNames.Bool)
-        Sdf.AttributeSpec(parent, "foo_2", Sdf.ValueTypeNames.Bool).defaultValue = True
-        Sdf.AttributeSpec(parent, "foo_3", Sdf.ValueTypeNames.Bool).defaultValue = Sdf.ValueBlock
+        # The specs are authored within a change block so that a single change notice is sent
+        with Sdf.ChangeBlock():
+            parent: Sdf.PrimSpec = Sdf.CreatePrimInLayer(self.layer, Sdf.Path("/primSpec"))
+            Sdf.RelationshipSpec(parent, "foo")
+            Sdf.AttributeSpec(parent, "foo_1", BOOL_TYPE)
+            Sdf.AttributeSpec(parent, "foo_2", BOOL_TYPE).defaultValue = True
+            Sdf.AttributeSpec(parent, "foo_3", BOOL_TYPE).defaultValue = Sdf.ValueBlock
         self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo_4")
 
         # However child names are not reserved if the path exists in the NameCache before the prims are defined
@@ -771,9 +842,9 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Existing property names are reserved regardless of them being relationships, attributes, authored, un-authored or blocked.
         parent: Usd.Prim = self.stage.DefinePrim(Sdf.Path("/prim"))
         parent.CreateRelationship("foo")
-        parent.CreateAttribute("foo_1", Sdf.ValueTypeNames.Bool)
-        parent.CreateAttribute("foo_2", Sdf.ValueTypeNames.Bool).Set(False)
-        parent.CreateAttribute("foo_3", Sdf.ValueTypeNames.Bool).Block()
+        parent.CreateAttribute("foo_1", BOOL_TYPE)
+        parent.CreateAttribute("foo_2", BOOL_TYPE).Set(False)
+        parent.CreateAttribute("foo_3", BOOL_TYPE).Block()
         self.assertEqual(self.nameCache.getPropertyNames(parent, ["foo", "foo"]), ["foo_4", "foo_5"])
 
         # However property names are not reserved if the path exists in the NameCache before the properties are defined
@@ -792,11 +863,13 @@ class NameCacheTestCase(usdex.test.TestCase):
 
         # If a SdfPrimSpec has existing properties, then those names will be reserved when the names for that path are requested
         # Existing property names are reserved regardless of them being relationships, attributes, authored, un-authored or blocked.
-        parent: Sdf.PrimSpec = Sdf.CreatePrimInLayer(self.layer, Sdf.Path("/primSpec"))
-        Sdf.RelationshipSpec(parent, "foo")
-        Sdf.AttributeSpec(parent, "foo_1", Sdf.ValueTypeNames.Bool)
-        Sdf.AttributeSpec(parent, "foo_2", Sdf.ValueTypeNames.Bool).defaultValue = True
-        Sdf.AttributeSpec(parent, "foo_3", Sdf.ValueTypeNames.Bool).defaultValue = Sdf.ValueBlock
+        # The specs are authored within a change block so that a single change notice is sent
+        with Sdf.ChangeBlock():
+            parent: Sdf.PrimSpec = Sdf.CreatePrimInLayer(self.layer, Sdf.Path("/primSpec"))
+            Sdf.RelationshipSpec(parent, "foo")
+            Sdf.AttributeSpec(parent, "foo_1", BOOL_TYPE)
+            Sdf.AttributeSpec(parent, "foo_2", BOOL_TYPE).defaultValue = True
+            Sdf.AttributeSpec(parent, "foo_3", BOOL_TYPE).defaultValue = Sdf.ValueBlock
         self.assertEqual(self.nameCache.getPropertyNames(parent, ["foo", "foo"]), ["foo_4", "foo_5"])
 
         # However child names are not reserved if the path exists in the NameCache before the prims are defined
@@ -826,29 +899,31 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The updatePrimNames() function forces the names of existing child prims to be added to the reserved names
 
+        getPrimName = self.nameCache.getPrimName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPrimName(parent, "test")
+        getPrimName(parent, "test")
 
         # Defining a child does not stop that name from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("foo"))
-        self.assertEqual(self.nameCache.getPrimName(parent, "foo"), "foo")
+        self.assertEqual(getPrimName(parent, "foo"), "foo")
 
         # Defining a child then calling updatePrimNames() does stop that name from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("bar"))
         self.nameCache.updatePrimNames(parent)
-        self.assertEqual(self.nameCache.getPrimName(parent, "bar"), "bar_1")
+        self.assertEqual(getPrimName(parent, "bar"), "bar_1")
 
         # The update does not clear already reserved names that are not child prim names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test_1")
+        self.assertEqual(getPrimName(parent, "test"), "test_1")
 
         # An SdfPrimSpec can also be passed to updatePrimNames()
         self.stage.DefinePrim(parent.GetPath().AppendChild("baz"))
         self.nameCache.updatePrimNames(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPrimName(parent, "baz"), "baz_1")
+        self.assertEqual(getPrimName(parent, "baz"), "baz_1")
 
         # The update does not clear already reserved names that are not existing prim names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test_2")
+        self.assertEqual(getPrimName(parent, "test"), "test_2")
 
     def testUpdatePrimNamesInvalidParent(self):
         func, args, result, message = self.nameCache.updatePrimNames, [], None, "Unable to update prim names:"
@@ -859,29 +934,31 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The updatePropertyNames() function forces the names of existing properties to be added to the reserved names
 
+        getPropertyName = self.nameCache.getPropertyName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPropertyName(parent, "test")
+        getPropertyName(parent, "test")
 
         # Defining a property does not stop that name from being returned
         parent.CreateRelationship("foo")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo")
+        self.assertEqual(getPropertyName(parent, "foo"), "foo")
 
         # Defining a property then calling updatePrimNames() does stop that name from being returned
         parent.CreateRelationship("bar")
         self.nameCache.updatePropertyNames(parent)
-        self.assertEqual(self.nameCache.getPropertyName(parent, "bar"), "bar_1")
+        self.assertEqual(getPropertyName(parent, "bar"), "bar_1")
 
         # The update does not clear already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test_1")
+        self.assertEqual(getPropertyName(parent, "test"), "test_1")
 
         # An SdfPrimSpec can also be passed to updatePropertyNames()
         parent.CreateRelationship("baz")
         self.nameCache.updatePropertyNames(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPropertyName(parent, "baz"), "baz_1")
+        self.assertEqual(getPropertyName(parent, "baz"), "baz_1")
 
         # The update does not clear already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test_2")
+        self.assertEqual(getPropertyName(parent, "test"), "test_2")
 
     def testUpdatePropertyNamesInvalidParent(self):
         func, args, result, message = self.nameCache.updatePropertyNames, [], None, "Unable to update property names:"
@@ -892,38 +969,41 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The update() function forces the names of existing prims and properties to be added to the reserved names
 
+        getPrimName = self.nameCache.getPrimName
+        getPropertyName = self.nameCache.getPropertyName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPrimName(parent, "test")
-        self.nameCache.getPropertyName(parent, "test")
+        getPrimName(parent, "test")
+        getPropertyName(parent, "test")
 
         # Defining a prim or property does not stop those names from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("foo"))
         parent.CreateRelationship("foo")
-        self.assertEqual(self.nameCache.getPrimName(parent, "foo"), "foo")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo")
+        self.assertEqual(getPrimName(parent, "foo"), "foo")
+        self.assertEqual(getPropertyName(parent, "foo"), "foo")
 
         # Defining a prim or property then calling update() does stop those names from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("bar"))
         parent.CreateRelationship("bar")
         self.nameCache.update(parent)
-        self.assertEqual(self.nameCache.getPrimName(parent, "bar"), "bar_1")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "bar"), "bar_1")
+        self.assertEqual(getPrimName(parent, "bar"), "bar_1")
+        self.assertEqual(getPropertyName(parent, "bar"), "bar_1")
 
         # The update does not clear already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test_1")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test_1")
+        self.assertEqual(getPrimName(parent, "test"), "test_1")
+        self.assertEqual(getPropertyName(parent, "test"), "test_1")
 
         # An SdfPrimSpec can also be passed to update()
         self.stage.DefinePrim(parent.GetPath().AppendChild("baz"))
         parent.CreateRelationship("baz")
         self.nameCache.update(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPrimName(parent, "baz"), "baz_1")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "baz"), "baz_1")
+        self.assertEqual(getPrimName(parent, "baz"), "baz_1")
+        self.assertEqual(getPropertyName(parent, "baz"), "baz_1")
 
         # The update does not clear already reserved names that are not existing prim or property names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test_2")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test_2")
+        self.assertEqual(getPrimName(parent, "test"), "test_2")
+        self.assertEqual(getPropertyName(parent, "test"), "test_2")
 
     def testUpdateInvalidParent(self):
         func, args, result, message = self.nameCache.update, [], None, "Unable to update prim and property names:"
@@ -934,29 +1014,31 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The clearPrimNames() function removes the path from the cache
 
+        getPrimName = self.nameCache.getPrimName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPrimName(parent, "test")
+        getPrimName(parent, "test")
 
         # Defining a child does not stop that name from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("foo"))
-        self.assertEqual(self.nameCache.getPrimName(parent, "foo"), "foo")
+        self.assertEqual(getPrimName(parent, "foo"), "foo")
 
         # Defining a child then calling clearPrimNames() does stop that name from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("bar"))
         self.nameCache.clearPrimNames(parent)
-        self.assertEqual(self.nameCache.getPrimName(parent, "bar"), "bar_1")
+        self.assertEqual(getPrimName(parent, "bar"), "bar_1")
 
         # The update clears already reserved names that are not child prim names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test")
+        self.assertEqual(getPrimName(parent, "test"), "test")
 
         # An SdfPrimSpec can also be passed to clearPrimNames()
         self.stage.DefinePrim(parent.GetPath().AppendChild("baz"))
         self.nameCache.clearPrimNames(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPrimName(parent, "baz"), "baz_1")
+        self.assertEqual(getPrimName(parent, "baz"), "baz_1")
 
         # The update clears already reserved names that are not existing prim names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test")
+        self.assertEqual(getPrimName(parent, "test"), "test")
 
     def testClearPrimNamesInvalidParent(self):
         func, args, result, message = self.nameCache.clearPrimNames, [], None, "Unable to clear prim names:"
@@ -968,29 +1050,31 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The clearPropertyNames() function removes the path from the cache
 
+        getPropertyName = self.nameCache.getPropertyName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPropertyName(parent, "test")
+        getPropertyName(parent, "test")
 
         # Defining a property does not stop that name from being returned
         parent.CreateRelationship("foo")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo")
+        self.assertEqual(getPropertyName(parent, "foo"), "foo")
 
         # Defining a property then calling updatePrimNames() does stop that name from being returned
         parent.CreateRelationship("bar")
         self.nameCache.clearPropertyNames(parent)
-        self.assertEqual(self.nameCache.getPropertyName(parent, "bar"), "bar_1")
+        self.assertEqual(getPropertyName(parent, "bar"), "bar_1")
 
         # The update clears already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test")
+        self.assertEqual(getPropertyName(parent, "test"), "test")
 
         # An SdfPrimSpec can also be passed to updatePropertyNames()
         parent.CreateRelationship("baz")
         self.nameCache.clearPropertyNames(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPropertyName(parent, "baz"), "baz_1")
+        self.assertEqual(getPropertyName(parent, "baz"), "baz_1")
 
         # The update clears already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test")
+        self.assertEqual(getPropertyName(parent, "test"), "test")
 
     def testClearPropertyNamesInvalidParent(self):
         func, args, result, message = self.nameCache.clearPropertyNames, [], None, "Unable to clear property names:"
@@ -1002,38 +1086,41 @@ class NameCacheTestCase(usdex.test.TestCase):
         # Updates to the stage are not reflected in the reserved names if a path exists in the NameCache
         # The clear() function removes the path from the cache
 
+        getPrimName = self.nameCache.getPrimName
+        getPropertyName = self.nameCache.getPropertyName
+
         # Add path to the NameCache
         parent = self.stage.DefinePrim("/parent")
-        self.nameCache.getPrimName(parent, "test")
-        self.nameCache.getPropertyName(parent, "test")
+        getPrimName(parent, "test")
+        getPropertyName(parent, "test")
 
         # Defining a prim or property does not stop those names from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("foo"))
         parent.CreateRelationship("foo")
-        self.assertEqual(self.nameCache.getPrimName(parent, "foo"), "foo")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "foo"), "foo")
+        self.assertEqual(getPrimName(parent, "foo"), "foo")
+        self.assertEqual(getPropertyName(parent, "foo"), "foo")
 
         # Defining a prim or property then calling update() does stop those names from being returned
         self.stage.DefinePrim(parent.GetPath().AppendChild("bar"))
         parent.CreateRelationship("bar")
         self.nameCache.clear(parent)
-        self.assertEqual(self.nameCache.getPrimName(parent, "bar"), "bar_1")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "bar"), "bar_1")
+        self.assertEqual(getPrimName(parent, "bar"), "bar_1")
+        self.assertEqual(getPropertyName(parent, "bar"), "bar_1")
 
         # The update does not clear already reserved names that are not existing property names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test")
+        self.assertEqual(getPrimName(parent, "test"), "test")
+        self.assertEqual(getPropertyName(parent, "test"), "test")
 
         # An SdfPrimSpec can also be passed to update()
         self.stage.DefinePrim(parent.GetPath().AppendChild("baz"))
         parent.CreateRelationship("baz")
         self.nameCache.clear(self.layer.GetPrimAtPath(parent.GetPath()))
-        self.assertEqual(self.nameCache.getPrimName(parent, "baz"), "baz_1")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "baz"), "baz_1")
+        self.assertEqual(getPrimName(parent, "baz"), "baz_1")
+        self.assertEqual(getPropertyName(parent, "baz"), "baz_1")
 
         # The update does not clear already reserved names that are not existing prim or property names
-        self.assertEqual(self.nameCache.getPrimName(parent, "test"), "test")
-        self.assertEqual(self.nameCache.getPropertyName(parent, "test"), "test")
+        self.assertEqual(getPrimName(parent, "test"), "test")
+        self.assertEqual(getPropertyName(parent, "test"), "test")
 
     def testClearInvalidParent(self):
         func, args, result, message = self.nameCache.clear, [], None, "Unable to clear prim and property names:"
@@ -6,7 +6,11 @@ from typing import List, Tuple
 
 import usdex.core
 import usdex.test
-from pxr import Gf, Usd, UsdGeom, UsdPhysics, UsdShade
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
+
+IDENTITY_PIVOT = Gf.Vec3d(0.0, 0.0, 0.0)
+IDENTITY_ROTATE = Gf.Vec3f(0.0, 0.0, 0.0)
+IDENTITY_SCALE = Gf.Vec3f(1.0, 1.0, 1.0)
 
 
 class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
@@ -21,49 +25,63 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         ]
     )
 
+    # The display color of the spheres created by the bind tests
+    sphereColor = Gf.Vec3f(1.0, 0.0, 0.0)
+
+    # The diffuseColor, opacity, roughness and metallic values of the visual materials
+    previewMaterialArgs = (Gf.Vec3f(0, 1, 0), 1.0, 0.3, 1.0)
+
+    # The dynamicFriction, staticFriction, restitution and density values of the physics materials created by the bind tests
+    physicsMaterialArgs = (0.5, 0.1, 0.2, 0.3)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Configure a layer once, each test opens a stage on a copy of it rather than configuring a new stage
+        cls.configuredLayer = Sdf.Layer.CreateAnonymous()
+        usdex.core.configureStage(
+            Usd.Stage.Open(cls.configuredLayer), cls.defaultPrimName, cls.defaultUpAxis, cls.defaultLinearUnits, cls.defaultAuthoringMetadata
+        )
+
+    # Open a stage on a copy of the configured layer.
+    def createConfiguredStage(self) -> Usd.Stage:
+        layer = Sdf.Layer.CreateAnonymous()
+        layer.TransferContent(self.configuredLayer)
+        return Usd.Stage.Open(layer)
+
     # Check whether the physics material is stored correctly.
     def assertIsPhysicsMaterial(self, material: UsdShade.Material, dynamicFriction: float, staticFriction: float, restitution: float, density: float):
         self.assertTrue(material.GetPrim().HasAPI(UsdPhysics.MaterialAPI))
         materialAPI = UsdPhysics.MaterialAPI(material.GetPrim())
 
-        attr = materialAPI.GetDensityAttr()
-        self.assertTrue(attr.IsDefined())
-        self.assertTrue(attr.HasAuthoredValue())
-        self.assertAlmostEqual(attr.Get(), density, places=6)
-
-        attr = materialAPI.GetDynamicFrictionAttr()
-        self.assertTrue(attr.IsDefined())
-        self.assertTrue(attr.HasAuthoredValue())
-        self.assertAlmostEqual(attr.Get(), dynamicFriction, places=6)
-
-        attr = materialAPI.GetStaticFrictionAttr()
-        self.assertTrue(attr.IsDefined())
-        self.assertTrue(attr.HasAuthoredValue())
-        self.assertAlmostEqual(attr.Get(), staticFriction, places=6)
-
-        attr = materialAPI.GetRestitutionAttr()
-        self.assertTrue(attr.IsDefined())
-        self.assertTrue(attr.HasAuthoredValue())
-        self.assertAlmostEqual(attr.Get(), restitution, places=6)
+        attrs = (
+            (materialAPI.GetDensityAttr(), density),
+            (materialAPI.GetDynamicFrictionAttr(), dynamicFriction),
+            (materialAPI.GetStaticFrictionAttr(), staticFriction),
+            (materialAPI.GetRestitutionAttr(), restitution),
+        )
+        for attr, value in attrs:
+            self.assertTrue(attr.IsDefined())
+            self.assertTrue(attr.HasAuthoredValue())
+            self.assertAlmostEqual(attr.Get(), value, places=6, msg=attr.GetName())
 
     # Create a sphere with the given parameters.
-    def createSphere(self, stage: Usd.Stage, primPath: str, radius: float, color: Gf.Vec3f, position: Gf.Vec3d):
+    @staticmethod
+    def createSphere(stage: Usd.Stage, primPath: Sdf.Path, radius: float, color: Gf.Vec3f, position: Gf.Vec3d):
         sphereGeom = UsdGeom.Sphere.Define(stage, primPath)
         sphereGeom.CreateRadiusAttr(radius)
         sphereGeom.CreateDisplayColorAttr([color])
         prim = sphereGeom.GetPrim()
-        usdex.core.setLocalTransform(
-            prim, Gf.Vec3d(position), Gf.Vec3d(0, 0, 0), Gf.Vec3f(0, 0, 0), usdex.core.RotationOrder.eXyz, Gf.Vec3f(1.0, 1.0, 1.0)
-        )
+        usdex.core.setLocalTransform(prim, Gf.Vec3d(position), IDENTITY_PIVOT, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
         return prim
 
     # Test the physics material define.
     def testPhysicsMaterialDefine(self):
-        stage = Usd.Stage.CreateInMemory()
-        usdex.core.configureStage(stage, self.defaultPrimName, self.defaultUpAxis, self.defaultLinearUnits, self.defaultAuthoringMetadata)
+        stage = self.createConfiguredStage()
 
         defaultPrimPath = stage.GetDefaultPrim().GetPath()
-        materialPath = f"{defaultPrimPath}/physics_material"
+        materialPath = defaultPrimPath.AppendChild("physics_material")
 
         # Create a physics material.
         dynamicFriction = 0.5
@@ -78,7 +96,7 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         self.assertIsPhysicsMaterial(material, dynamicFriction, staticFriction, restitution, density)
 
         # Create a Physics material within the specified xform.
-        xformPath = f"{defaultPrimPath}/Physics"
+        xformPath = defaultPrimPath.AppendChild("Physics")
         xform = usdex.core.defineXform(stage, xformPath)
 
         materialName = "physics_material2"
@@ -87,7 +105,6 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         restitution = 0.25
         density = 0.35
         material = usdex.core.definePhysicsMaterial(xform.GetPrim(), materialName, dynamicFriction, staticFriction, restitution, density)
-        self.assertTrue(material.GetPrim())
         self.assertIsValidUsd(stage)
 
         # Compare whether the value is stored correctly.
@@ -105,18 +122,13 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
 
     # Test the physics material bind with an existing material.
     def testPhysicsMaterialDefine_existingMaterial(self):
-        stage = Usd.Stage.CreateInMemory()
-        usdex.core.configureStage(stage, self.defaultPrimName, self.defaultUpAxis, self.defaultLinearUnits, self.defaultAuthoringMetadata)
+        stage = self.createConfiguredStage()
 
         defaultPrimPath = stage.GetDefaultPrim().GetPath()
-        materialPath = f"{defaultPrimPath}/material"
+        materialPath = defaultPrimPath.AppendChild("material")
 
         # Create a visual material.
-        diffuseColor = Gf.Vec3f(0, 1, 0)
-        opacity = 1.0
-        roughness = 0.3
-        metallic = 1.0
-        material = usdex.core.definePreviewMaterial(stage, materialPath, diffuseColor, opacity, roughness, metallic)
+        material = usdex.core.definePreviewMaterial(stage, materialPath, *self.previewMaterialArgs)
         self.assertTrue(material.GetPrim())
 
         # Assigning physics materials to prims of the same material.
@@ -131,7 +143,7 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         # Check Visual Material Connection.
         surfaceConnect = material.GetSurfaceOutput().GetValueProducingAttributes()
         self.assertEqual(len(surfaceConnect), 1)
-        self.assertEqual(surfaceConnect[0].GetPrim().GetPath(), f"{material.GetPrim().GetPath()}/PreviewSurface")
+        self.assertEqual(surfaceConnect[0].GetPrim().GetPath(), material.GetPrim().GetPath().AppendChild("PreviewSurface"))
 
         # Compare whether the physics material is stored correctly.
         self.assertIsPhysicsMaterial(material, dynamicFriction, staticFriction, restitution, density)
@@ -147,35 +159,37 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
 
     # Test the physics material bind.
     def testPhysicsMaterialBind(self):
-        stage = Usd.Stage.CreateInMemory()
-        usdex.core.configureStage(stage, self.defaultPrimName, self.defaultUpAxis, self.defaultLinearUnits, self.defaultAuthoringMetadata)
+        stage = self.createConfiguredStage()
 
         defaultPrimPath = stage.GetDefaultPrim().GetPath()
-        materialPath = f"{defaultPrimPath}/physics_material"
+        materialPath = defaultPrimPath.AppendChild("physics_material")
 
         # ------------------------------------------------------------.
         # Bind physics material to a sphere.
         # ------------------------------------------------------------.
         # Create a physics material.
-        dynamicFriction = 0.5
-        staticFriction = 0.1
-        restitution = 0.2
-        density = 0.3
-        physics_material = usdex.core.definePhysicsMaterial(stage, materialPath, dynamicFriction, staticFriction, restitution, density)
+        physics_material = usdex.core.definePhysicsMaterial(stage, materialPath, *self.physicsMaterialArgs)
         self.assertTrue(physics_material.GetPrim())
-        self.assertIsValidUsd(stage)
 
-        # Create a sphere.
-        spherePath = f"{defaultPrimPath}/sphere"
-        position = Gf.Vec3f(0.0, 50.0, 0.0)
-        spherePrim = self.createSphere(stage, spherePath, 0.5, Gf.Vec3f(1.0, 0.0, 0.0), position)
-        self.assertTrue(spherePrim)
+        # Create the visual material shared by the visual and physics binding order scenarios.
+        visual_material = usdex.core.definePreviewMaterial(stage, defaultPrimPath.AppendChild("visual_material"), *self.previewMaterialArgs)
+        self.assertTrue(visual_material.GetPrim())
+
+        # Create the spheres for all of the bind scenarios in one pass, each scenario binds to its own sphere.
+        spherePrims = []
+        for i, sphereName in enumerate(("sphere", "sphere2", "sphere3", "sphere4")):
+            position = Gf.Vec3f(2.0 * i, 50.0, 0.0)
+            spherePrim = self.createSphere(stage, defaultPrimPath.AppendChild(sphereName), 0.5, self.sphereColor, position)
+            self.assertTrue(spherePrim)
+            spherePrims.append(spherePrim)
+
+        spherePrim = spherePrims[0]
+        bindingAPI = UsdShade.MaterialBindingAPI(spherePrim)
 
         self.assertTrue(usdex.core.bindPhysicsMaterial(spherePrim, physics_material))
-        self.assertIsValidUsd(stage)
 
         # Get and check material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel("physics")
+        rel = bindingAPI.GetDirectBindingRel("physics")
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], physics_material.GetPrim().GetPath())
@@ -183,20 +197,8 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         # ------------------------------------------------------------.
         # Bind the visual material first, then the physics material.
         # ------------------------------------------------------------.
-        # Create a sphere.
-        spherePath = f"{defaultPrimPath}/sphere2"
-        position = Gf.Vec3f(2.0, 50.0, 0.0)
-        spherePrim = self.createSphere(stage, spherePath, 0.5, Gf.Vec3f(1.0, 0.0, 0.0), position)
-        self.assertTrue(spherePrim)
-
-        # Create a visual material.
-        materialPath = f"{defaultPrimPath}/visual_material"
-        diffuseColor = Gf.Vec3f(0, 1, 0)
-        opacity = 1.0
-        roughness = 0.3
-        metallic = 1.0
-        visual_material = usdex.core.definePreviewMaterial(stage, materialPath, diffuseColor, opacity, roughness, metallic)
-        self.assertTrue(visual_material.GetPrim())
+        spherePrim = spherePrims[1]
+        bindingAPI = UsdShade.MaterialBindingAPI(spherePrim)
 
         # Bind visual material.
         self.assertTrue(usdex.core.bindMaterial(spherePrim, visual_material))
@@ -205,13 +207,13 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         self.assertTrue(usdex.core.bindPhysicsMaterial(spherePrim, physics_material))
 
         # Get and check visual material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel()
+        rel = bindingAPI.GetDirectBindingRel()
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], visual_material.GetPrim().GetPath())
 
         # Get and check physics material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel("physics")
+        rel = bindingAPI.GetDirectBindingRel("physics")
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], physics_material.GetPrim().GetPath())
@@ -219,11 +221,8 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         # ------------------------------------------------------------.
         # Bind the physics material first, then the visual material.
         # ------------------------------------------------------------.
-        # Create a sphere.
-        spherePath = f"{defaultPrimPath}/sphere3"
-        position = Gf.Vec3f(4.0, 50.0, 0.0)
-        spherePrim = self.createSphere(stage, spherePath, 0.5, Gf.Vec3f(1.0, 0.0, 0.0), position)
-        self.assertTrue(spherePrim)
+        spherePrim = spherePrims[2]
+        bindingAPI = UsdShade.MaterialBindingAPI(spherePrim)
 
         # Bind physics material.
         self.assertTrue(usdex.core.bindPhysicsMaterial(spherePrim, physics_material))
@@ -232,13 +231,13 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         self.assertTrue(usdex.core.bindMaterial(spherePrim, visual_material))
 
         # Get and check visual material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel()
+        rel = bindingAPI.GetDirectBindingRel()
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], visual_material.GetPrim().GetPath())
 
         # Get and check physics material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel("physics")
+        rel = bindingAPI.GetDirectBindingRel("physics")
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], physics_material.GetPrim().GetPath())
@@ -246,43 +245,32 @@ class PhysicsMaterialAlgoTest(usdex.test.DefineFunctionTestCase):
         # ------------------------------------------------------------.
         # Create and bind a material that has both visual and physics properties.
         # ------------------------------------------------------------.
-        # Create a sphere.
-        spherePath = f"{defaultPrimPath}/sphere4"
-        position = Gf.Vec3f(6.0, 50.0, 0.0)
-        spherePrim = self.createSphere(stage, spherePath, 0.5, Gf.Vec3f(1.0, 0.0, 0.0), position)
-        self.assertTrue(spherePrim)
+        spherePrim = spherePrims[3]
+        bindingAPI = UsdShade.MaterialBindingAPI(spherePrim)
 
         # Create a visual material.
-        materialPath = f"{defaultPrimPath}/visual_physics_material"
-        diffuseColor = Gf.Vec3f(0, 1, 0)
-        opacity = 1.0
-        roughness = 0.3
-        metallic = 1.0
-        visual_physics_material = usdex.core.definePreviewMaterial(stage, materialPath, diffuseColor, opacity, roughness, metallic)
+        materialPath = defaultPrimPath.AppendChild("visual_physics_material")
+        visual_physics_material = usdex.core.definePreviewMaterial(stage, materialPath, *self.previewMaterialArgs)
         self.assertTrue(visual_physics_material.GetPrim())
 
         # add physics material.
-        dynamicFriction = 0.5
-        staticFriction = 0.1
-        restitution = 0.2
-        density = 0.3
-        usdex.core.addPhysicsToMaterial(visual_physics_material, dynamicFriction, staticFriction, restitution, density)
-        self.assertTrue(visual_physics_material.GetPrim())
+        self.assertTrue(usdex.core.addPhysicsToMaterial(visual_physics_material, *self.physicsMaterialArgs))
 
         # Bind material.
         self.assertTrue(usdex.core.bindMaterial(spherePrim, visual_physics_material))
         self.assertTrue(usdex.core.bindPhysicsMaterial(spherePrim, visual_physics_material))
 
         # Get and check visual material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel()
+        rel = bindingAPI.GetDirectBindingRel()
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], visual_physics_material.GetPrim().GetPath())
 
         # Get and check physics material bindings.
-        rel = UsdShade.MaterialBindingAPI(spherePrim).GetDirectBindingRel("physics")
+        rel = bindingAPI.GetDirectBindingRel("physics")
         pathList = rel.GetTargets()
         self.assertEqual(len(pathList), 1)
         self.assertEqual(pathList[0], visual_physics_material.GetPrim().GetPath())
 
+        # The stage is validated once all of the materials have been defined and bound
         self.assertIsValidUsd(stage)
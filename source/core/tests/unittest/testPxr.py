@@ -16,5 +16,6 @@ class PxrTest(unittest.TestCase):
             del env["PATH"]
         # Run in subprocess to avoid usdex.core already being imported
         code = "from pxr import Tf; assert hasattr(Tf, 'Status')"
-        result = subprocess.run([sys.executable, "-c", code], capture_output=True, env=env)
+        # Only stderr is reported on failure, so stdout is discarded rather than piped back
+        result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env)
         self.assertEqual(result.returncode, 0, f"Failed to import pxr: {result.stderr.decode()}")
@@ -4,6 +4,7 @@
 
 import inspect
 import os
+import re
 import subprocess
 import sys
 
@@ -11,6 +12,31 @@ import usdex.core
 import usdex.test
 from pxr import Tf
 
+# Asserts the state of the transcoding setting and the names it produces, when run in a new interpreter
+TRANSCODING_COMMAND = inspect.cleandoc(
+    """
+    import usdex.core
+    from pxr import Tf
+    assert Tf.GetEnvSetting(usdex.core.enableTranscodingSetting) == {enabled}
+    assert usdex.core.getValidPrimName(r"sphere%$%#ad@$1") == "{invalidCharacters}"
+    assert usdex.core.getValidPrimName("1 mesh") == "{leadingNumeric}"
+    assert usdex.core.getValidPrimName("") == "{empty}"
+    """
+)
+
+# The names expected when the transcoding algorithm is used
+TRANSCODED_NAMES = dict(enabled=True, invalidCharacters="tn__spheread1_kAHAJ8jC", leadingNumeric="tn__1mesh_c5", empty="tn__")
+
+# The names expected when the fallback character substitution algorithm is used
+SUBSTITUTED_NAMES = dict(enabled=False, invalidCharacters="sphere____ad__1", leadingNumeric="_1_mesh", empty="_")
+
+# The commands are formatted once, the disabled command is shared by the invalid setting test
+ENABLED_TRANSCODING_COMMAND = TRANSCODING_COMMAND.format(**TRANSCODED_NAMES)
+DISABLED_TRANSCODING_COMMAND = TRANSCODING_COMMAND.format(**SUBSTITUTED_NAMES)
+
+# The warning emitted when the transcoding setting is disabled or has an invalid value
+TRANSCODING_OVERRIDDEN_PATTERN = re.compile(r".*USDEX_ENABLE_TRANSCODING is overridden to 'false'.*")
+
 
 class SettingsTest(usdex.test.TestCase):
 
@@ -32,40 +58,32 @@ class SettingsTest(usdex.test.TestCase):
             env=env,
             capture_output=True,
             encoding="utf-8",
-            universal_newlines=True,
         )
         if result.returncode != 0:
             self.fail(msg=result.stderr)
-        if expectedOutputPattern == "":
+        if not expectedOutputPattern:
             self.assertEqual(result.stderr, "")
         else:
             self.assertRegex(result.stderr, expectedOutputPattern)
 
     def testTranscodingSetting(self):
-        self.assertEqual(usdex.core.enableTranscodingSetting, "USDEX_ENABLE_TRANSCODING")
-        self.assertIsNotNone(Tf.GetEnvSetting(usdex.core.enableTranscodingSetting))
-        self.assertIsInstance(Tf.GetEnvSetting(usdex.core.enableTranscodingSetting), bool)
+        setting = usdex.core.enableTranscodingSetting
+        self.assertEqual(setting, "USDEX_ENABLE_TRANSCODING")
+        value = Tf.GetEnvSetting(setting)
+        self.assertIsNotNone(value)
+        self.assertIsInstance(value, bool)
         environValue = os.environ.get("USDEX_ENABLE_TRANSCODING", True)
         if environValue in ("False", "false", "0"):
-            self.assertFalse(Tf.GetEnvSetting(usdex.core.enableTranscodingSetting))
+            self.assertFalse(value)
         else:
-            self.assertTrue(Tf.GetEnvSetting(usdex.core.enableTranscodingSetting))
+            self.assertTrue(value)
 
     def testEnableTranscodingSetting(self):
         # when enabled the transcoding algorithm is used to make valid identifiers
         self.assertEnvSetting(
             setting=usdex.core.enableTranscodingSetting,
             value=True,
-            command=inspect.cleandoc(
-                """
-                import usdex.core
-                from pxr import Tf
-                assert Tf.GetEnvSetting(usdex.core.enableTranscodingSetting) == True
-                assert usdex.core.getValidPrimName(r"sphere%$%#ad@$1") == "tn__spheread1_kAHAJ8jC"
-                assert usdex.core.getValidPrimName("1 mesh") == "tn__1mesh_c5"
-                assert usdex.core.getValidPrimName("") == "tn__"
-                """
-            ),
+            command=ENABLED_TRANSCODING_COMMAND,
             expectedOutputPattern="",
         )
 
@@ -74,17 +92,8 @@ class SettingsTest(usdex.test.TestCase):
         self.assertEnvSetting(
             setting=usdex.core.enableTranscodingSetting,
             value=False,
-            command=inspect.cleandoc(
-                """
-                import usdex.core
-                from pxr import Tf
-                assert Tf.GetEnvSetting(usdex.core.enableTranscodingSetting) == False
-                assert usdex.core.getValidPrimName(r"sphere%$%#ad@$1") == "sphere____ad__1"
-                assert usdex.core.getValidPrimName("1 mesh") == "_1_mesh"
-                assert usdex.core.getValidPrimName("") == "_"
-                """
-            ),
-            expectedOutputPattern=".*USDEX_ENABLE_TRANSCODING is overridden to 'false'.*",
+            command=DISABLED_TRANSCODING_COMMAND,
+            expectedOutputPattern=TRANSCODING_OVERRIDDEN_PATTERN,
         )
 
     def testInvalidTranscodingSetting(self):
@@ -92,15 +101,6 @@ class SettingsTest(usdex.test.TestCase):
         self.assertEnvSetting(
             setting=usdex.core.enableTranscodingSetting,
             value="invalid value type",
-            command=inspect.cleandoc(
-                """
-                import usdex.core
-                from pxr import Tf
-                assert Tf.GetEnvSetting(usdex.core.enableTranscodingSetting) == False
-                assert usdex.core.getValidPrimName(r"sphere%$%#ad@$1") == "sphere____ad__1"
-                assert usdex.core.getValidPrimName("1 mesh") == "_1_mesh"
-                assert usdex.core.getValidPrimName("") == "_"
-                """
-            ),
-            expectedOutputPattern=".*USDEX_ENABLE_TRANSCODING is overridden to 'false'.*",
+            command=DISABLED_TRANSCODING_COMMAND,
+            expectedOutputPattern=TRANSCODING_OVERRIDDEN_PATTERN,
         )
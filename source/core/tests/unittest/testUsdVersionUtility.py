@@ -7,8 +7,8 @@ from pxr import Usd
 
 
 class UsdVersionTest(usdex.test.TestCase):
-    def __replaceMinorOrPatch(self, currentVersion: str, newMinorOrPatch: str) -> str:
-        parts = currentVersion.split(".")
+    def __replaceMinorOrPatch(self, currentVersionParts: tuple, newMinorOrPatch: str) -> str:
+        parts = list(currentVersionParts)
         if len(parts) >= 3:
             parts[2] = newMinorOrPatch  # Replace patch
         elif len(parts) >= 2:
@@ -20,7 +20,9 @@ class UsdVersionTest(usdex.test.TestCase):
         # Note that the comments in this test are based on the assumption that
         # the current version of USD is 0.25.05, which is the version at the time
         # of writing this test.
-        currentVersion = ".".join([str(x) for x in Usd.GetVersion()])
+        # The version components are converted to strings once and reused to build each of the versions compared below
+        currentVersionParts = tuple(str(x) for x in Usd.GetVersion())
+        currentVersion = ".".join(currentVersionParts)
         self.assertFalse(self.isUsdOlderThan(currentVersion))
 
         self.assertFalse(self.isUsdOlderThan("0"))  # Only major
@@ -31,24 +33,24 @@ class UsdVersionTest(usdex.test.TestCase):
         self.assertFalse(self.isUsdOlderThan("-1.0.0"))
 
         # Compare against something like 0.25.0
-        earlyYearCurrentVersion = self.__replaceMinorOrPatch(currentVersion, "0")
+        earlyYearCurrentVersion = self.__replaceMinorOrPatch(currentVersionParts, "0")
         self.assertFalse(self.isUsdOlderThan(earlyYearCurrentVersion))
 
         # Compare against something like 0.25.99
-        lateYearCurrentVersion = self.__replaceMinorOrPatch(currentVersion, "99")
+        lateYearCurrentVersion = self.__replaceMinorOrPatch(currentVersionParts, "99")
         self.assertTrue(self.isUsdOlderThan(lateYearCurrentVersion))
 
         # Make sure that 0.25.05 behaves properly
-        patch = currentVersion.split(".")[-1]
-        prependedCurrentVersion = self.__replaceMinorOrPatch(currentVersion, "0" + patch)
+        patch = currentVersionParts[-1]
+        prependedCurrentVersion = self.__replaceMinorOrPatch(currentVersionParts, "0" + patch)
         self.assertFalse(self.isUsdOlderThan(prependedCurrentVersion))
 
         # Make sure that 0.25.05-alpha is ignored
-        currentVersionAlpha = self.__replaceMinorOrPatch(currentVersion, patch + "-alpha")
+        currentVersionAlpha = self.__replaceMinorOrPatch(currentVersionParts, patch + "-alpha")
         self.assertFalse(self.isUsdOlderThan(currentVersionAlpha))
 
         # Make sure that 0.25.05+build is ignored
-        currentVersionAlpha = self.__replaceMinorOrPatch(currentVersion, patch + "+build")
+        currentVersionAlpha = self.__replaceMinorOrPatch(currentVersionParts, patch + "+build")
         self.assertFalse(self.isUsdOlderThan(currentVersionAlpha))
 
         self.assertTrue(self.isUsdOlderThan("9999.0.0"))
@@ -13,72 +13,71 @@ IDENTITY_MATRIX = Gf.Matrix4d().SetIdentity()
 IDENTITY_TRANSFORM = Gf.Transform().SetIdentity()
 IDENTITY_ORIENTATION = Gf.Quatf.GetIdentity()
 
-IDENTITY_COMPONENTS = tuple(
-    [
-        IDENTITY_TRANSLATE,
-        IDENTITY_TRANSLATE,
-        IDENTITY_ROTATE,
-        usdex.core.RotationOrder.eXyz,
-        IDENTITY_SCALE,
-    ],
+DEFAULT_TIME_CODE = Usd.TimeCode.Default()
+TIME_CODE_5 = Usd.TimeCode(5.0)
+TIME_CODE_10 = Usd.TimeCode(10.0)
+
+IDENTITY_COMPONENTS = (
+    IDENTITY_TRANSLATE,
+    IDENTITY_TRANSLATE,
+    IDENTITY_ROTATE,
+    usdex.core.RotationOrder.eXyz,
+    IDENTITY_SCALE,
 )
 
-IDENTITY_COMPONENTS_WITH_ORIENTATION_AND_PIVOT = tuple(
-    [
-        IDENTITY_TRANSLATE,
-        IDENTITY_TRANSLATE,
-        IDENTITY_ORIENTATION,
-        IDENTITY_SCALE,
-    ],
+IDENTITY_COMPONENTS_WITH_ORIENTATION_AND_PIVOT = (
+    IDENTITY_TRANSLATE,
+    IDENTITY_TRANSLATE,
+    IDENTITY_ORIENTATION,
+    IDENTITY_SCALE,
 )
 
-IDENTITY_COMPONENTS_WITH_ORIENTATION = tuple(
-    [
-        IDENTITY_TRANSLATE,
-        IDENTITY_ORIENTATION,
-        IDENTITY_SCALE,
-    ],
+IDENTITY_COMPONENTS_WITH_ORIENTATION = (
+    IDENTITY_TRANSLATE,
+    IDENTITY_ORIENTATION,
+    IDENTITY_SCALE,
 )
 
 NON_IDENTITY_TRANSLATE = Gf.Vec3d(10.0, 20.0, 30.0)
 NON_IDENTITY_ROTATE = Gf.Vec3f(45.0, 0.0, 0.0)
 NON_IDENTITY_SCALE = Gf.Vec3f(2.0, 2.0, 2.0)
-NON_IDENTITY_ROTATION = Gf.Rotation(Gf.Vec3d.XAxis(), 45.0)
+X_AXIS = Gf.Vec3d.XAxis()
+NON_IDENTITY_ROTATION = Gf.Rotation(X_AXIS, 45.0)
 NON_IDENTITY_ORIENTATION = Gf.Quatf(NON_IDENTITY_ROTATION.GetQuat())
 
-NON_IDENTITY_COMPONENTS = tuple(
-    [
-        NON_IDENTITY_TRANSLATE,
-        NON_IDENTITY_TRANSLATE,
-        NON_IDENTITY_ROTATE,
-        usdex.core.RotationOrder.eXyz,
-        NON_IDENTITY_SCALE,
-    ],
+NON_IDENTITY_COMPONENTS = (
+    NON_IDENTITY_TRANSLATE,
+    NON_IDENTITY_TRANSLATE,
+    NON_IDENTITY_ROTATE,
+    usdex.core.RotationOrder.eXyz,
+    NON_IDENTITY_SCALE,
 )
 
-NON_IDENTITY_COMPONENTS_WITH_ORIENTATION_AND_PIVOT = tuple(
-    [
-        NON_IDENTITY_TRANSLATE,
-        NON_IDENTITY_TRANSLATE,
-        NON_IDENTITY_ORIENTATION,
-        NON_IDENTITY_SCALE,
-    ],
+NON_IDENTITY_COMPONENTS_WITH_ORIENTATION_AND_PIVOT = (
+    NON_IDENTITY_TRANSLATE,
+    NON_IDENTITY_TRANSLATE,
+    NON_IDENTITY_ORIENTATION,
+    NON_IDENTITY_SCALE,
 )
 
-NON_IDENTITY_COMPONENTS_WITH_ORIENTATION = tuple(
-    [
-        NON_IDENTITY_TRANSLATE,
-        NON_IDENTITY_ORIENTATION,
-        NON_IDENTITY_SCALE,
-    ],
+NON_IDENTITY_COMPONENTS_WITH_ORIENTATION = (
+    NON_IDENTITY_TRANSLATE,
+    NON_IDENTITY_ORIENTATION,
+    NON_IDENTITY_SCALE,
 )
 
+NON_IDENTITY_NO_PIVOT_TRANSFORM = Gf.Transform()
+NON_IDENTITY_NO_PIVOT_TRANSFORM.SetTranslation(NON_IDENTITY_TRANSLATE)
+NON_IDENTITY_NO_PIVOT_TRANSFORM.SetRotation(NON_IDENTITY_ROTATION)
+NON_IDENTITY_NO_PIVOT_TRANSFORM.SetScale(Gf.Vec3d(NON_IDENTITY_SCALE))
+NON_IDENTITY_NO_PIVOT_MATRIX = NON_IDENTITY_NO_PIVOT_TRANSFORM.GetMatrix()
+
 NON_IDENTITY_TRANSFORM = Gf.Transform()
 NON_IDENTITY_TRANSFORM.SetTranslation(NON_IDENTITY_TRANSLATE)
 NON_IDENTITY_TRANSFORM.SetRotation(NON_IDENTITY_ROTATION)
 NON_IDENTITY_TRANSFORM.SetScale(Gf.Vec3d(NON_IDENTITY_SCALE))
-NON_IDENTITY_NO_PIVOT_MATRIX = NON_IDENTITY_TRANSFORM.GetMatrix()
 NON_IDENTITY_TRANSFORM.SetPivotPosition(NON_IDENTITY_TRANSLATE)
+NON_IDENTITY_MATRIX = NON_IDENTITY_TRANSFORM.GetMatrix()
 
 PIVOT_POSITION_TRANSFORM = Gf.Transform()
 PIVOT_POSITION_TRANSFORM.SetPivotPosition(NON_IDENTITY_TRANSLATE)
@@ -87,9 +86,18 @@ PIVOT_POSITION_AND_ORIENTATION_TRANSFORM = Gf.Transform()
 PIVOT_POSITION_AND_ORIENTATION_TRANSFORM.SetPivotPosition(NON_IDENTITY_TRANSLATE)
 PIVOT_POSITION_AND_ORIENTATION_TRANSFORM.SetPivotOrientation(NON_IDENTITY_ROTATION)
 
-NON_IDENTITY_MATRIX = NON_IDENTITY_TRANSFORM.GetMatrix()
+# The local transforms of the "/Root/Animated_Matrix" test prim at the default time, at its time samples and interpolated between them
+ANIMATED_TRANSFORM_DEFAULT = Gf.Transform().SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
+ANIMATED_TRANSFORM_TIME_0 = Gf.Transform().SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
+ANIMATED_TRANSFORM_TIME_5 = Gf.Transform().SetTranslation(Gf.Vec3d(55.0, 65.0, 75.0))
+ANIMATED_TRANSFORM_TIME_10 = Gf.Transform().SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
+ANIMATED_MATRIX_DEFAULT = ANIMATED_TRANSFORM_DEFAULT.GetMatrix()
+ANIMATED_MATRIX_TIME_0 = ANIMATED_TRANSFORM_TIME_0.GetMatrix()
+ANIMATED_MATRIX_TIME_5 = ANIMATED_TRANSFORM_TIME_5.GetMatrix()
+ANIMATED_MATRIX_TIME_10 = ANIMATED_TRANSFORM_TIME_10.GetMatrix()
 
 MATRIX_XFORM_OP_ORDER = Vt.TokenArray(["xformOp:transform"])
+CUSTOM_MATRIX_XFORM_OP_ORDER = Vt.TokenArray(["xformOp:transform:custom"])
 COMPONENT_XFORM_OP_ORDER = Vt.TokenArray(
     [
         "xformOp:translate",
@@ -119,112 +127,120 @@ COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER = Vt.TokenArray(
 
 class BaseXformTestCase(usdex.test.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The test layers are authored by the first test that requests a stage and are copied for each test after that
+        cls._testLayers = None
+
     def _createTestStage(self):
         """Create an in memory stage holding a range of prims that are useful for testing"""
+        cls = type(self)
+        if cls._testLayers is None:
+            cls._testLayers = self._authorTestLayers()
+
+        # Rebuild the layered stage from copies of the authored layers
+        rootLayer, strongerLayer, weakerLayer = (Sdf.Layer.CreateAnonymous(name) for name in ("Root", "Stronger", "Weaker"))
+        for layer, testLayer in zip((rootLayer, strongerLayer, weakerLayer), cls._testLayers):
+            layer.TransferContent(testLayer)
+        rootLayer.subLayerPaths = [strongerLayer.identifier, weakerLayer.identifier]
+
+        stage = Usd.Stage.Open(rootLayer)
+        stage.SetEditTarget(Usd.EditTarget(strongerLayer))
+        return stage
+
+    def _authorTestLayers(self):
+        """Author a range of prims that are useful for testing and return the root, stronger and weaker layers"""
 
         # Build a layered stage
-        weakerLayer = self.tmpLayer(name="Weaker")
-        strongerLayer = self.tmpLayer(name="Stronger")
+        weakerLayer = Sdf.Layer.CreateAnonymous("Weaker")
+        strongerLayer = Sdf.Layer.CreateAnonymous("Stronger")
 
         rootLayer = Sdf.Layer.CreateAnonymous()
-        rootLayer.subLayerPaths.append(strongerLayer.identifier)
-        rootLayer.subLayerPaths.append(weakerLayer.identifier)
+        rootLayer.subLayerPaths = [strongerLayer.identifier, weakerLayer.identifier]
 
         stage = Usd.Stage.Open(rootLayer)
 
-        # Define the standard "/Root" prim in the root layer
-        stage.SetEditTarget(Usd.EditTarget(rootLayer))
+        # Define the standard "/Root" prim in the root layer, which is the default edit target
         usdex.core.defineXform(stage, "/Root").GetPrim()
         usdex.core.configureStage(stage, self.defaultPrimName, self.defaultUpAxis, self.defaultLinearUnits, self.defaultAuthoringMetadata)
 
         # Define test prims in the weaker layer
-        stage.SetEditTarget(Usd.EditTarget(weakerLayer))
-
-        # Define an xformable (Xform) and a non-xformable (Scope) prim with no transforms
-        usdex.core.defineXform(stage, "/Root/Xform")
-        UsdGeom.Scope.Define(stage, "/Root/Scope")
-
-        # Define an xformable (Xform) with a default and time sampled transform matrix
-        xform = usdex.core.defineXform(stage, "/Root/Animated_Matrix")
-        xformOp = xform.MakeMatrixXform()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
-        xformOp.Set(transform.GetMatrix(), Usd.TimeCode.Default())
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
-        xformOp.Set(transform.GetMatrix(), Usd.TimeCode(0.0))
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
-        xformOp.Set(transform.GetMatrix(), Usd.TimeCode(10.0))
-
-        # Define an xformable (Xform) with xformOps but an empty xformOpOrder
-        xform = usdex.core.defineXform(stage, "/Root/Empty_Xform_Op_Order")
-        xformOp = xform.MakeMatrixXform()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
-        xformOp.Set(transform.GetMatrix(), Usd.TimeCode.Default())
-
-        xform.ClearXformOpOrder()
-
-        # Define an xformable (Xform) with a matrix xformOp and matching xformOpOrder
-        xform = usdex.core.defineXform(stage, "/Root/Matrix_Xform_Op_Order")
-        xformOp = xform.MakeMatrixXform()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
-        xformOp.Set(transform.GetMatrix(), Usd.TimeCode.Default())
-
-        # Define an xformable (Xform) with default and time sampled transform components using the XformCommonAPI
-        xform = usdex.core.defineXform(stage, "/Root/Animated_Xform_Common_API")
-        xformCommonAPI = UsdGeom.XformCommonAPI(xform.GetPrim())
-        xformOps = xformCommonAPI.CreateXformOps(
-            UsdGeom.XformCommonAPI.RotationOrderXYZ,
-            UsdGeom.XformCommonAPI.OpTranslate,
-            UsdGeom.XformCommonAPI.OpRotate,
-        )
-
-        # Set time samples on the translate
-        translateXformOp = xformOps[0]
-        translateXformOp.Set(Gf.Vec3d(10.0, 20.0, 30.0), Usd.TimeCode.Default())
-        translateXformOp.Set(Gf.Vec3d(40.0, 50.0, 60.0), Usd.TimeCode(0.0))
-        translateXformOp.Set(Gf.Vec3d(70.0, 80.0, 90.0), Usd.TimeCode(10.0))
-
-        # Set time samples on the rotate
-        # The rotation is intentionally greater than 360 degrees as this which will cause data loss when using a 4x4 matrix
-        rotateXformOp = xformOps[2]
-        rotateXformOp.Set(Gf.Vec3f(360.0, 360.0, 0.0), Usd.TimeCode.Default())
-        rotateXformOp.Set(Gf.Vec3f(180.0, 0.0, 0.0), Usd.TimeCode(0.0))
-        rotateXformOp.Set(Gf.Vec3f(540.0, 0.0, 0.0), Usd.TimeCode(10.0))
-
-        # Create a Prim and then add an instanceable reference to it from within /Root
-        # This can be used to create scenarios where a path points to an instance proxy prim.
-        stage.CreateClassPrim("/Prototypes")
-        usdex.core.defineXform(stage, "/Prototypes/Prototype")
-        xformPrim = usdex.core.defineXform(stage, "/Root/Instance").GetPrim()
-        xformPrim.GetReferences().AddInternalReference(Sdf.Path("/Prototypes/Prototype"))
-        xformPrim.SetInstanceable(True)
-
-        # Set the edit target to the stronger layer
-        stage.SetEditTarget(Usd.EditTarget(strongerLayer))
+        with Usd.EditContext(stage, Usd.EditTarget(weakerLayer)):
+            # Define an xformable (Xform) and a non-xformable (Scope) prim with no transforms
+            usdex.core.defineXform(stage, "/Root/Xform")
+            UsdGeom.Scope.Define(stage, "/Root/Scope")
+
+            # The default and time sampled translations shared by the animated prims
+            translateSamples = (
+                (Usd.TimeCode.Default(), Gf.Vec3d(10.0, 20.0, 30.0)),
+                (Usd.TimeCode(0.0), Gf.Vec3d(40.0, 50.0, 60.0)),
+                (Usd.TimeCode(10.0), Gf.Vec3d(70.0, 80.0, 90.0)),
+            )
+
+            # Define an xformable (Xform) with a default and time sampled transform matrix
+            xform = usdex.core.defineXform(stage, "/Root/Animated_Matrix")
+            xformOp = xform.MakeMatrixXform()
+
+            for time, translate in translateSamples:
+                xformOp.Set(Gf.Matrix4d().SetTranslate(translate), time)
+
+            # Define an xformable (Xform) with xformOps but an empty xformOpOrder
+            xform = usdex.core.defineXform(stage, "/Root/Empty_Xform_Op_Order")
+            xformOp = xform.MakeMatrixXform()
+            xformOp.Set(Gf.Matrix4d().SetTranslate(Gf.Vec3d(10.0, 20.0, 30.0)), Usd.TimeCode.Default())
+
+            xform.ClearXformOpOrder()
+
+            # Define an xformable (Xform) with a matrix xformOp and matching xformOpOrder
+            xform = usdex.core.defineXform(stage, "/Root/Matrix_Xform_Op_Order")
+            xformOp = xform.MakeMatrixXform()
+            xformOp.Set(Gf.Matrix4d().SetTranslate(Gf.Vec3d(10.0, 20.0, 30.0)), Usd.TimeCode.Default())
+
+            # Define an xformable (Xform) with default and time sampled transform components using the XformCommonAPI
+            xform = usdex.core.defineXform(stage, "/Root/Animated_Xform_Common_API")
+            xformCommonAPI = UsdGeom.XformCommonAPI(xform.GetPrim())
+            xformOps = xformCommonAPI.CreateXformOps(
+                UsdGeom.XformCommonAPI.RotationOrderXYZ,
+                UsdGeom.XformCommonAPI.OpTranslate,
+                UsdGeom.XformCommonAPI.OpRotate,
+            )
+
+            # Set time samples on the translate
+            translateXformOp = xformOps[0]
+            for time, translate in translateSamples:
+                translateXformOp.Set(translate, time)
+
+            # Set time samples on the rotate
+            # The rotation is intentionally greater than 360 degrees as this which will cause data loss when using a 4x4 matrix
+            rotateXformOp = xformOps[2]
+            rotateXformOp.Set(Gf.Vec3f(360.0, 360.0, 0.0), Usd.TimeCode.Default())
+            rotateXformOp.Set(Gf.Vec3f(180.0, 0.0, 0.0), Usd.TimeCode(0.0))
+            rotateXformOp.Set(Gf.Vec3f(540.0, 0.0, 0.0), Usd.TimeCode(10.0))
+
+            # Create a Prim and then add an instanceable reference to it from within /Root
+            # This can be used to create scenarios where a path points to an instance proxy prim.
+            stage.CreateClassPrim("/Prototypes")
+            usdex.core.defineXform(stage, "/Prototypes/Prototype")
+            xformPrim = usdex.core.defineXform(stage, "/Root/Instance").GetPrim()
+            xformPrim.GetReferences().AddInternalReference(Sdf.Path("/Prototypes/Prototype"))
+            xformPrim.SetInstanceable(True)
 
         self.assertIsValidUsd(stage)
 
-        return stage
+        return rootLayer, strongerLayer, weakerLayer
 
     def assertTupleWithQuatAlmostEqual(self, tuple1, tuple2, places=6):
-        for vector in range(len(tuple1)):
-            if isinstance(tuple1[vector], Gf.Quatf):
-                self.assertAlmostEqual(abs(Gf.Dot(tuple1[vector], tuple2[vector])), 1.0, places=places)
+        self.assertEqual(len(tuple1), len(tuple2))
+        for first, second in zip(tuple1, tuple2):
+            if isinstance(first, Gf.Quatf):
+                self.assertAlmostEqual(abs(Gf.Dot(first, second)), 1.0, places=places)
             else:
-                self.assertAlmostEqual(tuple1[vector], tuple2[vector])
+                self.assertAlmostEqual(first, second)
 
     def assertNoExtraneousXformOps(self, prim):
         xformable = UsdGeom.Xformable(prim)
-        xformOpOrder = xformable.GetXformOpOrderAttr().Get()
+        xformOpOrder = set(xformable.GetXformOpOrderAttr().Get() or ())
         for prop in prim.GetAuthoredPropertyNames():
             if prop.startswith("xformOp:"):
                 self.assertIn(prop, xformOpOrder, f"Found xformOp {prop} not in xformOpOrder")
@@ -233,15 +249,10 @@ class BaseXformTestCase(usdex.test.TestCase):
     def _removeXformableProperties(prim):
         """Remove attributes from the UsdGeom.Xformable schema from a prim"""
         # This function will only remove properties from the current edit targets layer
-        for name in prim.GetAuthoredPropertyNames():
-            # Remove schema explicit properties
-            if name == UsdGeom.Tokens.xformOpOrder:
-                prim.RemoveProperty(name)
-                continue
-            # Remove schema namespaced properties
-            if name.startswith("xformOp:"):
-                prim.RemoveProperty(name)
-                continue
+        # Collect the schema explicit and namespaced properties before removing any of them
+        names = [name for name in prim.GetAuthoredPropertyNames() if name == UsdGeom.Tokens.xformOpOrder or name.startswith("xformOp:")]
+        for name in names:
+            prim.RemoveProperty(name)
 
     @staticmethod
     def _getOrderedXformOpPrecisions(xformable):
@@ -252,13 +263,9 @@ class BaseXformTestCase(usdex.test.TestCase):
 class BaseSetLocalTransformTestCase(BaseXformTestCase):
     def assertValuesAuthoredForXformOpsAtTimes(self, xformable, times):
         """Assert that for all the xformOps in the xformOpOrder there are authored values at all the given times"""
-        for xformOp in xformable.GetOrderedXformOps():
-
-            # Skip inverse xformOps because they do not have an associated attribute
-            if xformOp.IsInverseOp():
-                continue
-
-            attr = xformOp.GetAttr()
+        # Skip inverse xformOps because they do not have an associated attribute
+        attrs = [xformOp.GetAttr() for xformOp in xformable.GetOrderedXformOps() if not xformOp.IsInverseOp()]
+        for attr in attrs:
             for time in times:
                 self.assertAttributeHasAuthoredValue(attr, time)
 
@@ -318,6 +325,7 @@ class SetLocalTransformWithTransformTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # In cases where there is no authored xformOpOrder
         # The xformOpOrder attribute should be authored on the prim if the function call is successful
@@ -325,42 +333,42 @@ class SetLocalTransformWithTransformTestCase(BaseSetLocalTransformTestCase):
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test without specifying a time
         # The default time should be used
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test default time
-        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test a time sample
-        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, Usd.TimeCode(5.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0)])
+        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, TIME_CODE_5)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5])
 
         # Test a second time sample
         # The new and previous time sample should be authored
-        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, Usd.TimeCode(10.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0)])
+        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, TIME_CODE_10)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10])
 
         # Test setting the default time when time samples are present
-        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0), Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10, DEFAULT_TIME_CODE])
         self.assertIsValidUsd(stage)
 
     def testDefaultXformOpOrder(self):
@@ -368,52 +376,53 @@ class SetLocalTransformWithTransformTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # An identity transform will be stored as a single transform op and the computed matrix will match that of the
         # transform that was passed in.
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_TRANSFORM.GetMatrix())
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # A transform with a pivot position will be stored as components in order to retain the pivot
         usdex.core.setLocalTransform(prim, PIVOT_POSITION_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), PIVOT_POSITION_TRANSFORM.GetMatrix())
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # A transform with a pivot position and a pivot orientation will be stored as matrix because components cannot encode
         # the pivot orientation
         usdex.core.setLocalTransform(prim, PIVOT_POSITION_AND_ORIENTATION_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), PIVOT_POSITION_AND_ORIENTATION_TRANSFORM.GetMatrix())
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Setting a value that cannot be encoded will result in a new xformOpOrder even if there are existing ops of the other format.
         # Start with a matrix xformOpOrder
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
 
         # Setting a transform with a pivot position will switch to a component xformOpOrder
         usdex.core.setLocalTransform(prim, PIVOT_POSITION_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
 
         # Setting a transform with a pivot position and pivot orientation will switch to a matrix xformOpOrder
         usdex.core.setLocalTransform(prim, PIVOT_POSITION_AND_ORIENTATION_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertIsValidUsd(stage)
 
     def testReuseTransformOps(self):
@@ -421,42 +430,43 @@ class SetLocalTransformWithTransformTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Add a transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp()
+        xformable.AddTransformOp()
 
         # When a transform xformOp is authored it should be reused
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add a transform xformOp that has a custom suffix
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(opSuffix="custom")
+        xformable.AddTransformOp(opSuffix="custom")
 
         # When a transform xformOp that has an op suffix is authored it should be reused
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), CUSTOM_MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add an inverse transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(isInverseOp=True)
+        xformable.AddTransformOp(isInverseOp=True)
 
         # When an inverse transform xformOp is authored it should not be reused
         usdex.core.setLocalTransform(prim, IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Clean the prim and add a transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(opSuffix="custom")
+        xformable.AddTransformOp(opSuffix="custom")
 
         # Setting a transform with a pivot position at this point will not reuse the transform xformOp because this would discard the pivot position.
         # Fidelity of components takes precedence over existing authored xformOpOrders.
         usdex.core.setLocalTransform(prim, PIVOT_POSITION_TRANSFORM)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), PIVOT_POSITION_TRANSFORM.GetMatrix())
         self.assertIsValidUsd(stage)
 
@@ -523,7 +533,7 @@ class SetLocalTransformWithTransformTestCase(BaseSetLocalTransformTestCase):
 
         # A non-identity matrix
         usdex.core.setLocalTransform(prim, NON_IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetLocalTransformation(), NON_IDENTITY_TRANSFORM.GetMatrix())
+        self.assertEqual(xformable.GetLocalTransformation(), NON_IDENTITY_MATRIX)
         self.assertIsValidUsd(stage)
 
 
@@ -571,6 +581,7 @@ class SetLocalTransformWithMatrixTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # In cases where there is no authored xformOpOrder
         # The xformOpOrder attribute should be authored on the prim if the function call is successful
@@ -578,42 +589,42 @@ class SetLocalTransformWithMatrixTestCase(BaseSetLocalTransformTestCase):
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test without specifying a time
         # The default time should be used
         usdex.core.setLocalTransform(prim, IDENTITY_MATRIX)
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test default time
-        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test a time sample
-        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, Usd.TimeCode(5.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0)])
+        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, TIME_CODE_5)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5])
 
         # Test a second time sample
         # The new and previous time sample should be authored
-        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, Usd.TimeCode(10.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0)])
+        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, TIME_CODE_10)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10])
 
         # Test setting the default time when time samples are present
-        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0), Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, IDENTITY_MATRIX, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10, DEFAULT_TIME_CODE])
         self.assertIsValidUsd(stage)
 
     def testReuseTransformOps(self):
@@ -621,32 +632,33 @@ class SetLocalTransformWithMatrixTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Add a transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp()
+        xformable.AddTransformOp()
 
         # When a transform xformOp is authored it should be reused
         usdex.core.setLocalTransform(prim, IDENTITY_MATRIX)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add a transform xformOp that has a custom suffix
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(opSuffix="custom")
+        xformable.AddTransformOp(opSuffix="custom")
 
         # When a transform xformOp that has an op suffix is authored it should be reused
         usdex.core.setLocalTransform(prim, IDENTITY_MATRIX)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), CUSTOM_MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add an inverse transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(isInverseOp=True)
+        xformable.AddTransformOp(isInverseOp=True)
 
         # When an inverse transform xformOp is authored it should not be reused
         usdex.core.setLocalTransform(prim, IDENTITY_MATRIX)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), MATRIX_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
         self.assertIsValidUsd(stage)
 
@@ -710,6 +722,7 @@ class SetLocalTransformWithComponentsTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # In cases where there is no authored xformOpOrder
         # The xformOpOrder attribute should be authored on the prim if the function call is successful
@@ -717,42 +730,42 @@ class SetLocalTransformWithComponentsTestCase(BaseSetLocalTransformTestCase):
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test without specifying a time
         # The default time should be used
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS)
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test default time
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test a time sample
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, Usd.TimeCode(5.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0)])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, TIME_CODE_5)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5])
 
         # Test a second time sample
         # The new and previous time sample should be authored
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, Usd.TimeCode(10.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0)])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, TIME_CODE_10)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10])
 
         # Test setting the default time when time samples are present
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0), Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10, DEFAULT_TIME_CODE])
         self.assertIsValidUsd(stage)
 
     def testDefaultXformOpOrder(self):
@@ -760,22 +773,23 @@ class SetLocalTransformWithComponentsTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Identity components will be stored as components
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Non-identity components will be stored as components
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertIsValidUsd(stage)
 
     def testReuseTransformOps(self):
@@ -783,42 +797,43 @@ class SetLocalTransformWithComponentsTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Add a transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp()
+        xformable.AddTransformOp()
 
         # When a transform xformOp is authored it should be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add a transform xformOp that has a custom suffix
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(opSuffix="custom")
+        xformable.AddTransformOp(opSuffix="custom")
 
         # When a transform xformOp that has an op suffix is authored it should be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), Vt.TokenArray([xformOp.GetOpName()]))
+        self.assertEqual(xformOpOrderAttr.Get(), CUSTOM_MATRIX_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add an inverse transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(isInverseOp=True)
+        xformable.AddTransformOp(isInverseOp=True)
 
         # When an inverse transform xformOp is authored it should not be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Clean the prim and add a transform xformOp
         self._removeXformableProperties(prim)
-        xformOp = xformable.AddTransformOp(opSuffix="custom")
+        xformable.AddTransformOp(opSuffix="custom")
 
         # Setting components with a pivot position at this point will not reuse the transform xformOp because this would discard the pivot position.
         # Fidelity of components takes precedence over existing authored xformOpOrders.
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), NON_IDENTITY_MATRIX)
         self.assertIsValidUsd(stage)
 
@@ -933,29 +948,32 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
         self._removeXformableProperties(prim)
         success = usdex.core.setLocalTransform(prim, translation=NON_IDENTITY_TRANSLATE, orientation=NON_IDENTITY_ORIENTATION)
         self.assertTrue(success)
         self.assertSuccessfulSetLocalTransform(prim)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
-        self.assertEqual(xformable.GetScaleOp().Get(), IDENTITY_SCALE)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        scaleOp = xformable.GetScaleOp()
+        self.assertEqual(scaleOp.Get(), IDENTITY_SCALE)
 
         # Author a non-identity scale, then check that default scale still works
-        xformable.GetScaleOp().Set(NON_IDENTITY_SCALE)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        scaleOp.Set(NON_IDENTITY_SCALE)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertMatricesAlmostEqual(xformable.GetLocalTransformation(), NON_IDENTITY_NO_PIVOT_MATRIX, places=6)
 
         success = usdex.core.setLocalTransform(prim, translation=NON_IDENTITY_TRANSLATE, orientation=NON_IDENTITY_ORIENTATION)
         self.assertTrue(success)
         self.assertSuccessfulSetLocalTransform(prim)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
-        self.assertEqual(xformable.GetScaleOp().Get(), IDENTITY_SCALE)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(scaleOp.Get(), IDENTITY_SCALE)
 
     def testTimeArgument(self):
         # The "time" argument is supported but optional
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # In cases where there is no authored xformOpOrder
         # The xformOpOrder attribute should be authored on the prim if the function call is successful
@@ -963,42 +981,42 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test without specifying a time
         # The default time should be used
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test default time
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [DEFAULT_TIME_CODE])
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Test a time sample
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, Usd.TimeCode(5.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0)])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, TIME_CODE_5)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5])
 
         # Test a second time sample
         # The new and previous time sample should be authored
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, Usd.TimeCode(10.0))
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0)])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, TIME_CODE_10)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10])
 
         # Test setting the default time when time samples are present
-        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, Usd.TimeCode.Default())
-        self.assertTrue(xformable.GetXformOpOrderAttr().IsAuthored())
-        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [Usd.TimeCode(5.0), Usd.TimeCode(10.0), Usd.TimeCode.Default()])
+        usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION, DEFAULT_TIME_CODE)
+        self.assertTrue(xformOpOrderAttr.IsAuthored())
+        self.assertValuesAuthoredForXformOpsAtTimes(xformable, [TIME_CODE_5, TIME_CODE_10, DEFAULT_TIME_CODE])
         self.assertIsValidUsd(stage)
 
     def testDefaultXformOpOrder(self):
@@ -1006,22 +1024,23 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Identity components with orientation will be stored as components
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
 
         # Clean the prim and assert that it is not transformed
         self._removeXformableProperties(prim)
-        self.assertFalse(xformable.GetXformOpOrderAttr().IsAuthored())
+        self.assertFalse(xformOpOrderAttr.IsAuthored())
 
         # Non-identity components with orientation will be stored as components
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertIsValidUsd(stage)
 
     def testReuseTransformOps(self):
@@ -1029,6 +1048,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # Add a transform xformOp
         self._removeXformableProperties(prim)
@@ -1036,7 +1056,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # When a transform xformOp is authored it should not be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add a transform xformOp that has a custom suffix
@@ -1045,7 +1065,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # When a transform xformOp that has an op suffix is authored it should not be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Add an inverse transform xformOp
@@ -1054,7 +1074,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # When an inverse transform xformOp is authored it should not be reused
         usdex.core.setLocalTransform(prim, *IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertEqual(xformable.GetLocalTransformation(), IDENTITY_MATRIX)
 
         # Clean the prim and add a transform xformOp
@@ -1064,7 +1084,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
         # Setting components with orientation at this point will not reuse the transform xformOp because this would discard the orientation.
         # Fidelity of components takes precedence over existing authored xformOpOrders.
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertMatricesAlmostEqual(xformable.GetLocalTransformation(), NON_IDENTITY_NO_PIVOT_MATRIX, places=6)
         self.assertIsValidUsd(stage)
 
@@ -1135,10 +1155,11 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Xform")
         xformable = UsdGeom.Xformable(prim)
+        xformOpOrderAttr = xformable.GetXformOpOrderAttr()
 
         # First set using rotation components
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertMatricesAlmostEqual(xformable.GetLocalTransformation(), NON_IDENTITY_MATRIX, places=6)
 
         # Verify no extraneous xformOps
@@ -1146,7 +1167,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # Then set using orientation components
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS_WITH_ORIENTATION)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_WITH_ORIENTATION_XFORM_OP_ORDER)
         self.assertMatricesAlmostEqual(xformable.GetLocalTransformation(), NON_IDENTITY_NO_PIVOT_MATRIX, places=6)
 
         # Verify no extraneous xformOps
@@ -1154,7 +1175,7 @@ class SetLocalTransformWithOrientationTestCase(BaseSetLocalTransformTestCase):
 
         # Then set back to rotation components
         usdex.core.setLocalTransform(prim, *NON_IDENTITY_COMPONENTS)
-        self.assertEqual(xformable.GetXformOpOrderAttr().Get(), COMPONENT_XFORM_OP_ORDER)
+        self.assertEqual(xformOpOrderAttr.Get(), COMPONENT_XFORM_OP_ORDER)
         self.assertMatricesAlmostEqual(xformable.GetLocalTransformation(), NON_IDENTITY_MATRIX, places=6)
 
         # Verify no extraneous xformOps
@@ -1209,52 +1230,39 @@ class GetLocalTransformTest(BaseXformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Animated_Matrix")
 
-        # Declare the expected values at different times
-        transformDefault = Gf.Transform()
-        transformDefault.SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
-
-        transformTime0 = Gf.Transform()
-        transformTime0.SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
-
-        transformTime5 = Gf.Transform()
-        transformTime5.SetTranslation(Gf.Vec3d(55.0, 65.0, 75.0))
-
-        transformTime10 = Gf.Transform()
-        transformTime10.SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
-
         # When "time" is not specified the "default" time is used
         transform = usdex.core.getLocalTransform(prim)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformDefault)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_DEFAULT)
 
         # The "default" time value is respected
         time = Usd.TimeCode.Default()
         transform = usdex.core.getLocalTransform(prim, time)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformDefault)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_DEFAULT)
 
         # The "earliest" time value is respected
         time = Usd.TimeCode.EarliestTime()
         transform = usdex.core.getLocalTransform(prim, time)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformTime0)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_TIME_0)
 
         # When a time value that matches a time sample is specified it is respected
         time = Usd.TimeCode(0.0)
         transform = usdex.core.getLocalTransform(prim, time)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformTime0)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_TIME_0)
 
         time = Usd.TimeCode(10.0)
         transform = usdex.core.getLocalTransform(prim, time)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformTime10)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_TIME_10)
 
         # When a time value that falls between a time sample is specified it is interpolated
         time = Usd.TimeCode(5.0)
         transform = usdex.core.getLocalTransform(prim, time)
         self.assertIsInstance(transform, Gf.Transform)
-        self.assertEqual(transform, transformTime5)
+        self.assertEqual(transform, ANIMATED_TRANSFORM_TIME_5)
         self.assertIsValidUsd(stage)
 
     def testXformCommonAPIXformOps(self):
@@ -1269,15 +1277,15 @@ class GetLocalTransformTest(BaseXformTestCase):
 
         expectedTime0 = Gf.Transform()
         expectedTime0.SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
-        expectedTime0.SetRotation(Gf.Rotation(Gf.Vec3d.XAxis(), 180.0))
+        expectedTime0.SetRotation(Gf.Rotation(X_AXIS, 180.0))
 
         expectedTime5 = Gf.Transform()
         expectedTime5.SetTranslation(Gf.Vec3d(55.0, 65.0, 75.0))
-        expectedTime5.SetRotation(Gf.Rotation(Gf.Vec3d.XAxis(), 360.0))
+        expectedTime5.SetRotation(Gf.Rotation(X_AXIS, 360.0))
 
         expectedTime10 = Gf.Transform()
         expectedTime10.SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
-        expectedTime10.SetRotation(Gf.Rotation(Gf.Vec3d.XAxis(), 540.0))
+        expectedTime10.SetRotation(Gf.Rotation(X_AXIS, 540.0))
 
         # Assert the expected values at different times
         returned = usdex.core.getLocalTransform(prim, Usd.TimeCode.Default())
@@ -1338,56 +1346,39 @@ class GetLocalTransformMatrixTest(BaseXformTestCase):
         stage = self._createTestStage()
         prim = stage.GetPrimAtPath("/Root/Animated_Matrix")
 
-        # Declare the expected values at different times
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(10.0, 20.0, 30.0))
-        matrixDefault = transform.GetMatrix()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
-        matrixTime0 = transform.GetMatrix()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(55.0, 65.0, 75.0))
-        matrixTime5 = transform.GetMatrix()
-
-        transform = Gf.Transform()
-        transform.SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
-        matrixTime10 = transform.GetMatrix()
-
         # When "time" is not specified the "default" time is used
         matrix = usdex.core.getLocalTransformMatrix(prim)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixDefault)
+        self.assertEqual(matrix, ANIMATED_MATRIX_DEFAULT)
 
         # The "default" time value is respected
         time = Usd.TimeCode.Default()
         matrix = usdex.core.getLocalTransformMatrix(prim, time)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixDefault)
+        self.assertEqual(matrix, ANIMATED_MATRIX_DEFAULT)
 
         # The "earliest" time value is respected
         time = Usd.TimeCode.EarliestTime()
         matrix = usdex.core.getLocalTransformMatrix(prim, time)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixTime0)
+        self.assertEqual(matrix, ANIMATED_MATRIX_TIME_0)
 
         # When a time value that matches a time sample is specified it is respected
         time = Usd.TimeCode(0.0)
         matrix = usdex.core.getLocalTransformMatrix(prim, time)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixTime0)
+        self.assertEqual(matrix, ANIMATED_MATRIX_TIME_0)
 
         time = Usd.TimeCode(10.0)
         matrix = usdex.core.getLocalTransformMatrix(prim, time)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixTime10)
+        self.assertEqual(matrix, ANIMATED_MATRIX_TIME_10)
 
         # When a time value that falls between a time sample is specified it is interpolated
         time = Usd.TimeCode(5.0)
         matrix = usdex.core.getLocalTransformMatrix(prim, time)
         self.assertIsInstance(matrix, Gf.Matrix4d)
-        self.assertEqual(matrix, matrixTime5)
+        self.assertEqual(matrix, ANIMATED_MATRIX_TIME_5)
         self.assertIsValidUsd(stage)
 
     def testXformCommonAPIXformOps(self):
@@ -1403,7 +1394,7 @@ class GetLocalTransformMatrixTest(BaseXformTestCase):
 
         transform = Gf.Transform()
         transform.SetTranslation(Gf.Vec3d(40.0, 50.0, 60.0))
-        transform.SetRotation(Gf.Rotation(Gf.Vec3d.XAxis(), 180.0))
+        transform.SetRotation(Gf.Rotation(X_AXIS, 180.0))
         matrixTime0 = transform.GetMatrix()
 
         transform = Gf.Transform()
@@ -1414,7 +1405,7 @@ class GetLocalTransformMatrixTest(BaseXformTestCase):
         transform = Gf.Transform()
         transform.SetTranslation(Gf.Vec3d(70.0, 80.0, 90.0))
         # There is a rotation of 180 degrees in the result because the 4x4 matrix treats 540 degrees as 180 degrees
-        transform.SetRotation(Gf.Rotation(Gf.Vec3d.XAxis(), 180.0))
+        transform.SetRotation(Gf.Rotation(X_AXIS, 180.0))
         matrixTime10 = transform.GetMatrix()
 
         # Assert the expected values at different times
@@ -1475,16 +1466,16 @@ class GetLocalTransformComponentsTest(BaseXformTestCase):
 
         # Declare the expected values at different times
         translation = Gf.Vec3d(10.0, 20.0, 30.0)
-        componentsDefault = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        componentsDefault = (translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(40.0, 50.0, 60.0)
-        componentsTime0 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        componentsTime0 = (translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(55.0, 65.0, 75.0)
-        componentsTime5 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        componentsTime5 = (translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(70.0, 80.0, 90.0)
-        componentsTime10 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        componentsTime10 = (translation, IDENTITY_TRANSLATE, IDENTITY_ROTATE, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         # When "time" is not specified the "default" time is used
         returned = usdex.core.getLocalTransformComponents(prim)
@@ -1529,19 +1520,19 @@ class GetLocalTransformComponentsTest(BaseXformTestCase):
         # Declare the expected values at different times
         translation = Gf.Vec3d(10.0, 20.0, 30.0)
         rotation = Gf.Vec3f(360.0, 360.0, 0.0)
-        expectedDefault = tuple([translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        expectedDefault = (translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(40.0, 50.0, 60.0)
         rotation = Gf.Vec3f(180.0, 0.0, 0.0)
-        expectedTime0 = tuple([translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        expectedTime0 = (translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(55.0, 65.0, 75.0)
         rotation = Gf.Vec3f(360.0, 0.0, 0.0)
-        expectedTime5 = tuple([translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        expectedTime5 = (translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(70.0, 80.0, 90.0)
         rotation = Gf.Vec3f(540.0, 0.0, 0.0)
-        expectedTime10 = tuple([translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE])
+        expectedTime10 = (translation, IDENTITY_TRANSLATE, rotation, usdex.core.RotationOrder.eXyz, IDENTITY_SCALE)
 
         # Assert the expected values at different times
         returned = usdex.core.getLocalTransformComponents(prim, Usd.TimeCode.Default())
@@ -1600,16 +1591,16 @@ class GetLocalTransformWithOrientationTest(BaseXformTestCase):
 
         # Declare the expected values at different times
         translation = Gf.Vec3d(10.0, 20.0, 30.0)
-        componentsDefault = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE])
+        componentsDefault = (translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(40.0, 50.0, 60.0)
-        componentsTime0 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE])
+        componentsTime0 = (translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(55.0, 65.0, 75.0)
-        componentsTime5 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE])
+        componentsTime5 = (translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(70.0, 80.0, 90.0)
-        componentsTime10 = tuple([translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE])
+        componentsTime10 = (translation, IDENTITY_TRANSLATE, IDENTITY_ORIENTATION, IDENTITY_SCALE)
 
         # When "time" is not specified the "default" time is used
         returned = usdex.core.getLocalTransformComponentsQuat(prim)
@@ -1653,20 +1644,20 @@ class GetLocalTransformWithOrientationTest(BaseXformTestCase):
 
         # Declare the expected values at different times
         translation = Gf.Vec3d(10.0, 20.0, 30.0)
-        orientation = Gf.Quatf.GetIdentity()
-        expectedDefault = tuple([translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE])
+        orientation = IDENTITY_ORIENTATION
+        expectedDefault = (translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(40.0, 50.0, 60.0)
         orientation = Gf.Quatf(0.0, 1.0, 0.0, 0.0)  # 180 degrees around X
-        expectedTime0 = tuple([translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE])
+        expectedTime0 = (translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(55.0, 65.0, 75.0)
-        orientation = Gf.Quatf.GetIdentity()  # 360 degrees around X
-        expectedTime5 = tuple([translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE])
+        orientation = IDENTITY_ORIENTATION  # 360 degrees around X
+        expectedTime5 = (translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE)
 
         translation = Gf.Vec3d(70.0, 80.0, 90.0)
         orientation = Gf.Quatf(0.0, 1.0, 0.0, 0.0)  # 180 degrees around X (540 degrees)
-        expectedTime10 = tuple([translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE])
+        expectedTime10 = (translation, IDENTITY_TRANSLATE, orientation, IDENTITY_SCALE)
 
         # Assert the expected values at different times
         returned = usdex.core.getLocalTransformComponentsQuat(prim, Usd.TimeCode.Default())
@@ -1760,7 +1751,7 @@ class SetLocalTransformWithTransformXformableTestCase(BaseSetLocalTransformTestC
         xformable = UsdGeom.Xformable(prim)
 
         usdex.core.setLocalTransform(xformable, NON_IDENTITY_TRANSFORM)
-        self.assertEqual(xformable.GetLocalTransformation(), NON_IDENTITY_TRANSFORM.GetMatrix())
+        self.assertEqual(xformable.GetLocalTransformation(), NON_IDENTITY_MATRIX)
         self.assertIsValidUsd(stage)
 
 
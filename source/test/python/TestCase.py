@@ -152,10 +152,7 @@ class TestCase(unittest.TestCase):
         """Assert that all 16 values of a pair of 4x4 matrices are equal, to a specified number of decimal places"""
         for row in range(4):
             for col in range(4):
-                x = first[row][col]
-                y = second[row][col]
-                self.assertEqual(round(x - y, places), 0)
-        self.assertTrue(True)
+                self.assertAlmostEqual(first[row][col], second[row][col], places, msg=f"[{row}][{col}]")
 
     def assertVecAlmostEqual(self, first, second, places=12):
         """Assert that all elements of a Vec are equal, to a specified number of decimal places"""
@@ -219,7 +216,7 @@ class TestCase(unittest.TestCase):
     @staticmethod
     def isUsdOlderThan(version: str):
         """Determine if the provided version is older than the current USD runtime"""
-        current_version = TestCase.__SemVersion(".".join([str(x) for x in Usd.GetVersion()]))
+        current_version = TestCase.__SemVersion.fromParts(Usd.GetVersion())
         compare_version = TestCase.__SemVersion(version)
         return current_version < compare_version
 
@@ -312,6 +309,13 @@ class TestCase(unittest.TestCase):
                     break
             self.parts = tuple(self.parts)
 
+        @classmethod
+        def fromParts(cls, parts):
+            # Build from numeric parts directly, without formatting and parsing a version string
+            version = cls.__new__(cls)
+            version.parts = tuple(parts)
+            return version
+
         def __eq__(self, other):
             return self.parts == other.parts
 